@@ -4,7 +4,6 @@ SIEM-Fusion Multi-LLM Integration System
 Entry point for running the complete system
 """
 
-import asyncio
 import sys
 import os
 
@@ -12,6 +11,8 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.main import main
+from src.core import event_loop, log
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    log.configure()
+    event_loop.run(main())
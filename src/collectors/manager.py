@@ -22,6 +22,7 @@ class CollectorManager:
         self.logger = logging.getLogger(__name__)
         self.running = False
         self.use_datasets = use_datasets
+        self._producer_tasks: List[asyncio.Task] = []
         
         # Initialize collectors
         self._initialize_collectors()
@@ -70,6 +71,10 @@ class CollectorManager:
         self.running = False
         self.logger.info("🛑 Stopping log collection...")
         
+        for task in self._producer_tasks:
+            task.cancel()
+        self._producer_tasks = []
+        
         for name, collector in self.collectors.items():
             if hasattr(collector, 'stop'):
                 await collector.stop()
@@ -83,26 +88,43 @@ class CollectorManager:
         if self.use_datasets:
             self.logger.info("📊 Loading security datasets...")
             dataset_count = 0
-            async for log_entry in dataset_loader.load_all_datasets():
-                dataset_count += 1
-                yield log_entry
+            async for batch in dataset_loader.load_all_datasets_batched():
+                for log_entry in batch:
+                    yield log_entry
+                dataset_count += len(batch)
                 
-                # Add delay every 50 entries to prevent overwhelming
-                if dataset_count % 50 == 0:
-                    await asyncio.sleep(0.5)
-                    self.logger.info(f"📈 Processed {dataset_count} dataset entries...")
+                # Yield to the scheduler once per batch to prevent overwhelming
+                await asyncio.sleep(0)
+                self.logger.info(f"📈 Processed {dataset_count} dataset entries...")
             
             self.logger.info(f"✅ Dataset loading complete: {dataset_count} entries")
         
-        # Then collect from live collectors
-        for name, collector in self.collectors.items():
-            if hasattr(collector, 'collect_logs'):
-                try:
-                    async for log_entry in collector.collect_logs():
-                        self.logger.debug(f"📥 Collected log from {name}: {log_entry.id}")
-                        yield log_entry
-                except Exception as e:
-                    self.logger.error(f"❌ Error collecting from {name}: {e}")
+        # Then fan in live collectors: one producer task per collector feeding a shared queue,
+        # so a quiet source never blocks the others
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
+        self._producer_tasks = [
+            asyncio.create_task(self._pump(name, collector, queue))
+            for name, collector in self.collectors.items()
+            if hasattr(collector, 'collect_logs')
+        ]
+        
+        try:
+            active_producers = len(self._producer_tasks)
+            while active_producers:
+                log_entry = await queue.get()
+                if log_entry is None:  # A collector's stream has ended
+                    active_producers -= 1
+                    continue
+                yield log_entry
+        finally:
+            for task in self._producer_tasks:
+                task.cancel()
+    
+    async def _pump(self, source_name: str, collector, queue: asyncio.Queue):
+        """Forward a collector's logs into the shared queue, then signal end of stream"""
+        async for log_entry in self._collect_from_source(source_name, collector):
+            await queue.put(log_entry)
+        await queue.put(None)
     
     async def _collect_from_source(self, source_name: str, collector) -> AsyncGenerator[LogEntry, None]:
         """Collect logs from a specific source"""
@@ -133,6 +155,14 @@ class CollectorManager:
         status['datasets'] = self.use_datasets
         return status
     
+    async def check_collector_health(self) -> Dict[str, bool]:
+        """Probe each collector's backend where it supports it, else report its running state"""
+        status = self.get_collector_status()
+        for name, collector in self.collectors.items():
+            if hasattr(collector, 'ping'):
+                status[name] = await collector.ping()
+        return status
+    
     def get_collector_stats(self) -> Dict[str, Dict]:
         """Get statistics from all collectors"""
         stats = {}
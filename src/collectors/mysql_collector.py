@@ -1,5 +1,6 @@
 import asyncio
-import pymysql
+import logging
+import aiomysql
 from datetime import datetime, timedelta
 from typing import AsyncGenerator, Dict, Any
 from src.collectors.base import BaseCollector
@@ -10,14 +11,17 @@ class MySQLCollector(BaseCollector):
     
     def __init__(self, config: dict):
         super().__init__(config)
+        self.logger = logging.getLogger(__name__)
         self.host = config.get('host', 'localhost')
         self.port = config.get('port', 3306)
         self.database = config.get('database', 'security_logs')
         self.username = config.get('username', 'siem_user')
         self.password = config.get('password', 'secure_password')
-        self.connection = None
+        self.pool = None
         self.running = False
+        # Keyset watermark: last (timestamp, id) seen, so equal timestamps are never re-read
         self.last_poll_time = datetime.now()
+        self.last_id = 0
         self.poll_interval = config.get('poll_interval', 30)  # seconds
     
     async def start(self):
@@ -26,93 +30,99 @@ class MySQLCollector(BaseCollector):
             return
         
         try:
-            self.connection = pymysql.connect(
-                host=self.host,
-                port=self.port,
-                user=self.username,
-                password=self.password,
-                database=self.database,
-                charset='utf8mb4',
-                cursorclass=pymysql.cursors.DictCursor
-            )
+            self.pool = await self._create_pool()
             self.running = True
-            print(f"MySQL collector connected to {self.host}:{self.port}/{self.database}")
+            self.logger.info("MySQL collector connected to %s:%s/%s", self.host, self.port, self.database)
         except Exception as e:
-            print(f"Failed to connect to MySQL: {e}")
+            self.logger.error("Failed to connect to MySQL: %s", e)
             raise
     
     async def stop(self):
         """Stop the MySQL collector"""
         self.running = False
-        if self.connection:
-            self.connection.close()
-        print("MySQL collector stopped")
+        if self.pool:
+            self.pool.close()
+            await self.pool.wait_closed()
+        self.logger.info("MySQL collector stopped")
     
     async def collect_logs(self) -> AsyncGenerator[RawLogEntry, None]:
         """Collect logs from MySQL database"""
         while self.running:
             try:
-                # Poll for new logs since last poll time
-                logs = await self._fetch_new_logs()
-                for log_data in logs:
-                    log_entry = self._create_log_entry(log_data)
-                    yield log_entry
-                
-                # Update last poll time
-                self.last_poll_time = datetime.now()
+                # Stream new logs past the (timestamp, id) watermark
+                async for log_data in self._fetch_new_logs():
+                    self.last_poll_time = log_data['timestamp']
+                    self.last_id = log_data['id']
+                    yield self._create_log_entry(log_data)
                 
                 # Wait before next poll
                 await asyncio.sleep(self.poll_interval)
                 
             except Exception as e:
-                print(f"Error collecting MySQL logs: {e}")
+                self.logger.error("Error collecting MySQL logs: %s", e)
                 await asyncio.sleep(5)  # Wait before retrying
     
-    async def _fetch_new_logs(self) -> list:
-        """Fetch new logs from the database"""
-        if not self.connection:
-            return []
+    async def _create_pool(self) -> aiomysql.Pool:
+        """Create the asyncio MySQL connection pool"""
+        return await aiomysql.create_pool(
+            host=self.host,
+            port=self.port,
+            user=self.username,
+            password=self.password,
+            db=self.database,
+            charset='utf8mb4',
+            minsize=1,
+            maxsize=4,
+            pool_recycle=300  # Replace connections idle longer than the server may keep them
+        )
+    
+    async def _fetch_new_logs(self) -> AsyncGenerator[Dict[str, Any], None]:
+        """Stream new logs from the database with a server-side cursor"""
+        if not self.pool:
+            return
         
         try:
-            with self.connection.cursor() as cursor:
-                # Query for logs newer than last poll time
-                # Assuming a table structure with timestamp, event_type, source_ip, etc.
-                query = """
-                SELECT id, timestamp, event_type, source_ip, destination_ip, 
-                       user, message, severity, raw_data
-                FROM security_events 
-                WHERE timestamp > %s 
-                ORDER BY timestamp ASC
-                LIMIT 1000
-                """
+            async with self.pool.acquire() as conn:
+                # Cheap liveness probe; reopens this pooled connection if the server dropped it
+                await conn.ping(reconnect=True)
                 
-                cursor.execute(query, (self.last_poll_time,))
-                return cursor.fetchall()
+                async with conn.cursor(aiomysql.SSDictCursor) as cursor:
+                    # Keyset query for logs past the (timestamp, id) watermark
+                    # Assuming a table structure with timestamp, event_type, source_ip, etc.
+                    # and a composite index on security_events (timestamp, id)
+                    query = """
+                    SELECT id, timestamp, event_type, source_ip, destination_ip, 
+                           user, message, severity, raw_data
+                    FROM security_events 
+                    WHERE (timestamp, id) > (%s, %s) 
+                    ORDER BY timestamp ASC, id ASC
+                    LIMIT 1000
+                    """
+                    
+                    await cursor.execute(query, (self.last_poll_time, self.last_id))
+                    async for row in cursor:
+                        yield row
         
-        except Exception as e:
-            print(f"Error fetching MySQL logs: {e}")
-            # Try to reconnect
+        except aiomysql.OperationalError as e:
+            # Connection-level failure: refresh the pool's connections
+            self.logger.error("MySQL connection error while fetching logs: %s", e)
             await self._reconnect()
-            return []
+        
+        except Exception as e:
+            # Query-level errors (e.g. ProgrammingError) leave the connections usable
+            self.logger.error("Error fetching MySQL logs: %s", e)
     
     async def _reconnect(self):
         """Reconnect to MySQL database"""
         try:
-            if self.connection:
-                self.connection.close()
-            
-            self.connection = pymysql.connect(
-                host=self.host,
-                port=self.port,
-                user=self.username,
-                password=self.password,
-                database=self.database,
-                charset='utf8mb4',
-                cursorclass=pymysql.cursors.DictCursor
-            )
-            print("MySQL collector reconnected")
+            if self.pool:
+                # Drop idle connections; in-use ones stay and the pool opens fresh ones on demand
+                await self.pool.clear()
+            else:
+                self.pool = await self._create_pool()
+            self.logger.info("MySQL collector reconnected")
         except Exception as e:
-            print(f"Failed to reconnect to MySQL: {e}")
+            self.logger.error("Failed to reconnect to MySQL: %s", e)
     
     def _create_log_entry(self, log_data: Dict[str, Any]) -> RawLogEntry:
         """Create RawLogEntry from MySQL log data"""
@@ -134,12 +144,17 @@ class MySQLCollector(BaseCollector):
     
     def health_check(self) -> bool:
         """Check if the MySQL collector is healthy"""
-        if not self.running or not self.connection:
+        # The pool is async, so a synchronous SELECT 1 probe is not possible here; see ping()
+        return self.running and self.pool is not None
+    
+    async def ping(self) -> bool:
+        """Probe the database with a non-blocking SELECT 1"""
+        if not self.pool:
             return False
         
         try:
-            with self.connection.cursor() as cursor:
-                cursor.execute("SELECT 1")
+            async with self.pool.acquire() as conn, conn.cursor() as cursor:
+                await cursor.execute("SELECT 1")
                 return True
         except Exception:
             return False
@@ -1,102 +1,241 @@
 import asyncio
+import logging
+import re
 import socket
 import json
 from datetime import datetime
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 from src.collectors.base import BaseCollector
 from src.models.schemas import RawLogEntry, LogSource
 
+try:
+    import hyperscan
+except ImportError:
+    # hyperscan is optional (x86 only); fall back to the compiled regex
+    hyperscan = None
+
+# Compiled once at import; only the first IPv4 address in a message is used
+_IP_PATTERN = rb'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b'
+_IP_RE = re.compile(_IP_PATTERN)
+
+def _compile_ip_database():
+    """Compile the IPv4 pattern into a Hyperscan block-mode database, if available"""
+    if hyperscan is None:
+        return None
+    
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    database.compile(
+        expressions=[_IP_PATTERN],
+        ids=[0],
+        elements=1,
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST]  # Report match start offsets too
+    )
+    return database
+
+_IP_DATABASE = _compile_ip_database()
+
+def _find_first_ip(data: bytes) -> Optional[str]:
+    """Return the first IPv4 address in the raw message bytes, or None"""
+    if _IP_DATABASE is None:
+        ip_match = _IP_RE.search(data)
+        return ip_match.group(0).decode('ascii') if ip_match else None
+    
+    found = []
+    
+    def on_match(pattern_id, start, end, flags, context):
+        found.append(data[start:end])
+        return True  # Stop at the first match
+    
+    try:
+        _IP_DATABASE.scan(data, match_event_handler=on_match)
+    except hyperscan.ScanTerminated:
+        pass
+    return found[0].decode('ascii') if found else None
+
+# Largest unterminated frame buffered before it is flushed as a message
+MAX_FRAME_SIZE = 65536
+
+# Parsed messages held before senders are paused, and messages handed out per wake-up
+MAX_QUEUE_SIZE = 10_000
+BATCH_SIZE = 256
+
+class SyslogProtocol(asyncio.Protocol):
+    """Frames newline-delimited syslog messages out of a reusable per-connection buffer"""
+    
+    def __init__(self, collector: "SyslogCollector"):
+        self.collector = collector
+        self.transport = None
+        self.buffer = bytearray()
+    
+    def connection_made(self, transport):
+        self.transport = transport
+        self.collector.transports.add(transport)
+    
+    def data_received(self, data: bytes):
+        self.buffer += data
+        self._process_buffer()
+    
+    def _process_buffer(self):
+        buffer = self.buffer
+        queue = self.collector.log_queue
+        
+        # Hand each complete frame on as bytes; decoding happens once, during parsing
+        start = 0
+        with memoryview(buffer) as view:
+            while not queue.full():
+                end = buffer.find(b'\n', start)
+                if end == -1:
+                    break
+                self.collector._handle_message(bytes(view[start:end]))
+                start = end + 1
+        del buffer[:start]
+        
+        if queue.full():
+            # Backpressure: keep the remaining frames buffered and stop reading from this sender
+            self.transport.pause_reading()
+            self.collector.paused_protocols.add(self)
+        elif len(buffer) > MAX_FRAME_SIZE:
+            self._flush()
+    
+    def resume(self):
+        """Resume reading once the consumer has made room in the queue"""
+        self.transport.resume_reading()
+        self._process_buffer()
+    
+    def connection_lost(self, exc):
+        # A trailing message without a newline is still a message
+        self._flush()
+        self.collector.transports.discard(self.transport)
+        self.collector.paused_protocols.discard(self)
+    
+    def _flush(self):
+        if self.buffer:
+            self.collector._handle_message(bytes(self.buffer))
+            self.buffer.clear()
+
+class SyslogDatagramProtocol(asyncio.DatagramProtocol):
+    """Receives UDP syslog, where each datagram is exactly one message"""
+    
+    def __init__(self, collector: "SyslogCollector"):
+        self.collector = collector
+    
+    def datagram_received(self, data: bytes, addr):
+        self.collector._handle_message(data, addr[0])
+    
+    def error_received(self, exc):
+        self.collector.logger.error("Syslog UDP error: %s", exc)
+
 class SyslogCollector(BaseCollector):
     """Collector for Syslog messages"""
     
     def __init__(self, config: dict):
         super().__init__(config)
+        self.logger = logging.getLogger(__name__)
         self.host = config.get('host', '0.0.0.0')
         self.port = config.get('port', 514)
+        self.udp = config.get('udp', True)
+        self.tcp = config.get('tcp', True)
         self.server = None
+        self.datagram_transport = None
+        self.transports = set()
+        self.paused_protocols = set()
         self.running = False
-        self.log_queue = asyncio.Queue()
+        self.log_queue = asyncio.Queue(maxsize=MAX_QUEUE_SIZE)
+        self.dropped_messages = 0
     
     async def start(self):
         """Start the syslog server"""
         if not self.enabled:
             return
         
-        self.server = await asyncio.start_server(
-            self._handle_client, self.host, self.port
-        )
+        loop = asyncio.get_running_loop()
+        if self.udp:
+            self.datagram_transport, _ = await loop.create_datagram_endpoint(
+                lambda: SyslogDatagramProtocol(self), local_addr=(self.host, self.port)
+            )
+        if self.tcp:
+            self.server = await loop.create_server(
+                lambda: SyslogProtocol(self), self.host, self.port
+            )
         self.running = True
-        print(f"Syslog collector started on {self.host}:{self.port}")
+        protocols = "/".join(name for name, on in (("UDP", self.udp), ("TCP", self.tcp)) if on)
+        self.logger.info("Syslog collector started on %s:%s (%s)", self.host, self.port, protocols)
     
     async def stop(self):
         """Stop the syslog server"""
         self.running = False
+        if self.datagram_transport:
+            self.datagram_transport.close()
+            self.datagram_transport = None
         if self.server:
             self.server.close()
+            for transport in list(self.transports):
+                transport.close()
             await self.server.wait_closed()
-        print("Syslog collector stopped")
-    
-    async def _handle_client(self, reader, writer):
-        """Handle incoming syslog messages"""
-        try:
-            while self.running:
-                data = await reader.read(4096)
-                if not data:
-                    break
-                
-                message = data.decode('utf-8', errors='ignore').strip()
-                if message:
-                    log_entry = self._parse_syslog_message(message)
-                    await self.log_queue.put(log_entry)
-        
-        except Exception as e:
-            print(f"Error handling syslog client: {e}")
-        finally:
-            writer.close()
-            await writer.wait_closed()
+        self.logger.info("Syslog collector stopped")
+    
+    def _handle_message(self, message: bytes, sender_ip: Optional[str] = None):
+        """Parse one framed syslog message and queue it"""
+        message = message.strip()
+        if message and self.running:
+            try:
+                self.log_queue.put_nowait(self._parse_syslog_message(message, sender_ip))
+            except asyncio.QueueFull:
+                self.dropped_messages += 1
+            except Exception as e:
+                self.logger.warning("Error handling syslog message: %s", e)
     
-    def _parse_syslog_message(self, message: str) -> RawLogEntry:
+    def _parse_syslog_message(self, message: bytes, sender_ip: Optional[str] = None) -> RawLogEntry:
         """Parse syslog message into RawLogEntry"""
         # Basic syslog parsing - can be enhanced for RFC3164/RFC5424
-        parts = message.split(' ', 5)
+        # Split the bytes and decode only the header fields kept in metadata
+        parts = [part.decode('utf-8', errors='replace') for part in message.split(b' ', 4)[:4]]
+        parts += [None] * (4 - len(parts))
         
         # Extract basic information
-        source_ip = None
         event_type = "syslog"
         
-        # Try to extract IP addresses from the message
-        import re
-        ip_pattern = r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b'
-        ips = re.findall(ip_pattern, message)
-        if ips:
-            source_ip = ips[0]
+        # Try to extract the first IP address from the message, else use the UDP sender's
+        source_ip = _find_first_ip(message) or sender_ip
         
         return RawLogEntry(
             source=LogSource.SYSLOG,
             timestamp=datetime.now(),
-            raw_data=message,
+            raw_data=message.decode('utf-8', errors='ignore'),
             source_ip=source_ip,
             event_type=event_type,
             log_metadata={
-                'facility': parts[0] if len(parts) > 0 else None,
-                'severity': parts[1] if len(parts) > 1 else None,
-                'hostname': parts[2] if len(parts) > 2 else None,
-                'process': parts[3] if len(parts) > 3 else None
+                'facility': parts[0],
+                'severity': parts[1],
+                'hostname': parts[2],
+                'process': parts[3],
+                'sender_ip': sender_ip
             }
         )
     
     async def collect_logs(self) -> AsyncGenerator[RawLogEntry, None]:
-        """Yield collected log entries"""
+        """Yield collected log entries, draining the queue in batches"""
         while self.running:
             try:
-                log_entry = await asyncio.wait_for(self.log_queue.get(), timeout=1.0)
-                yield log_entry
+                batch = [await asyncio.wait_for(self.log_queue.get(), timeout=1.0)]
+                while len(batch) < BATCH_SIZE and not self.log_queue.empty():
+                    batch.append(self.log_queue.get_nowait())
+                
+                # Room again: let paused senders resume
+                if self.paused_protocols:
+                    paused = list(self.paused_protocols)
+                    self.paused_protocols.clear()
+                    for protocol in paused:
+                        protocol.resume()
+                
+                for log_entry in batch:
+                    yield log_entry
             except asyncio.TimeoutError:
                 continue
             except Exception as e:
-                print(f"Error collecting syslog: {e}")
+                self.logger.error("Error collecting syslog: %s", e)
                 break
     
     def health_check(self) -> bool:
         """Check if the syslog collector is healthy"""
-        return self.running and self.server is not None
+        return self.running and (self.server is not None or self.datagram_transport is not None)
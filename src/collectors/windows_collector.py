@@ -1,126 +1,242 @@
 import asyncio
-import json
+import logging
 import subprocess
-from datetime import datetime
-from typing import AsyncGenerator, List
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from typing import AsyncGenerator, Dict, Optional, Tuple
 from src.collectors.base import BaseCollector
+from src.core.serialization import dumps, loads
 from src.models.schemas import RawLogEntry, LogSource
 
+try:
+    import win32evtlog
+except ImportError:
+    # pywin32 is only available on Windows; fall back to polling via PowerShell
+    win32evtlog = None
+
+# Longest single NDJSON record read from PowerShell
+MAX_RECORD_SIZE = 1 << 20
+
+_EVENT_NS = {'e': 'http://schemas.microsoft.com/win/2004/08/events/event'}
+_LEVEL_NAMES = {0: 'Information', 1: 'Critical', 2: 'Error', 3: 'Warning', 4: 'Information', 5: 'Verbose'}
+
+def _parse_event_time(value: str) -> datetime:
+    """Parse an event timestamp from either Get-WinEvent JSON or rendered event XML"""
+    # PowerShell's ConvertTo-Json emits DateTime as /Date(milliseconds)/
+    if value.startswith('/Date('):
+        return datetime.fromtimestamp(int(value[6:value.index(')')].split('+')[0]) / 1000, timezone.utc)
+    
+    try:
+        # C-level parser; accepts the trailing Z and 7-digit fractions on Python 3.11+
+        return datetime.fromisoformat(value)
+    except ValueError:
+        if value[-1:] != 'Z':
+            raise
+        return datetime.fromisoformat(value[:-1] + '+00:00')
+
+def _event_xml_to_dict(event_xml: str) -> dict:
+    """Convert a rendered event XML document into the same fields Get-WinEvent reports"""
+    system = ET.fromstring(event_xml).find('e:System', _EVENT_NS)
+    
+    def text(tag: str) -> Optional[str]:
+        element = system.find(f'e:{tag}', _EVENT_NS)
+        return element.text if element is not None else None
+    
+    def attr(tag: str, name: str) -> Optional[str]:
+        element = system.find(f'e:{tag}', _EVENT_NS)
+        return element.get(name) if element is not None else None
+    
+    level = int(text('Level') or 0)
+    process_id = attr('Execution', 'ProcessID')
+    thread_id = attr('Execution', 'ThreadID')
+    record_id = text('EventRecordID')
+    return {
+        'Id': int(text('EventID') or 0),
+        'RecordId': int(record_id) if record_id else None,
+        'LogName': text('Channel'),
+        'LevelDisplayName': _LEVEL_NAMES.get(level, 'Information'),
+        'TimeCreated': attr('TimeCreated', 'SystemTime'),
+        'ProviderName': attr('Provider', 'Name'),
+        'Keywords': text('Keywords'),
+        'ProcessId': int(process_id) if process_id else None,
+        'ThreadId': int(thread_id) if thread_id else None,
+        'MachineName': text('Computer'),
+        'UserId': attr('Security', 'UserID')
+    }
+
 class WindowsEventCollector(BaseCollector):
     """Collector for Windows Event Logs"""
     
     def __init__(self, config: dict):
         super().__init__(config)
+        self.logger = logging.getLogger(__name__)
         self.log_types = config.get('log_types', ['Security', 'System', 'Application'])
+        # Per-log-type id and event_type prefixes, built once instead of per event
+        self._id_prefix = {log_type: f"win_{log_type}_" for log_type in self.log_types}
+        self._event_type_prefix = {log_type: f"windows_{log_type.lower()}_" for log_type in self.log_types}
+        self._log_type_by_name = {log_type.lower(): log_type for log_type in self.log_types}
         self.running = False
         self.poll_interval = config.get('poll_interval', 60)  # seconds
         self.last_event_ids = {}  # Track last event ID for each log type
+        self.log_queue = asyncio.Queue()
+        self.subscriptions = []  # EvtSubscribe handles when pywin32 is available
+        self.loop = None
     
     async def start(self):
         """Start the Windows Event collector"""
         if not self.enabled:
             return
         
-        # Initialize last event IDs for each log type
-        for log_type in self.log_types:
-            self.last_event_ids[log_type] = await self._get_latest_event_id(log_type)
+        if win32evtlog is not None:
+            # Push subscription: Windows calls back for each new event, no polling
+            self.loop = asyncio.get_running_loop()
+            self.subscriptions = [
+                win32evtlog.EvtSubscribe(
+                    log_type,
+                    win32evtlog.EvtSubscribeToFutureEvents,
+                    None,
+                    Callback=self._on_event,
+                    Context=log_type
+                )
+                for log_type in self.log_types
+            ]
+        else:
+            # Initialize last event IDs for all log types in one PowerShell call
+            self.last_event_ids = await self._get_latest_event_ids()
         
         self.running = True
-        print(f"Windows Event collector started for logs: {', '.join(self.log_types)}")
+        self.logger.info("Windows Event collector started for logs: %s", ", ".join(self.log_types))
     
     async def stop(self):
         """Stop the Windows Event collector"""
         self.running = False
-        print("Windows Event collector stopped")
+        for subscription in self.subscriptions:
+            subscription.Close()
+        self.subscriptions = []
+        self.logger.info("Windows Event collector stopped")
+    
+    def _on_event(self, action, context, event):
+        """EvtSubscribe callback; runs on a Windows thread-pool thread"""
+        if action != win32evtlog.EvtSubscribeActionDeliver:
+            return
+        try:
+            event_xml = win32evtlog.EvtRender(event, win32evtlog.EvtRenderEventXml)
+            log_entry = self._create_log_entry(_event_xml_to_dict(event_xml), context)
+            self.loop.call_soon_threadsafe(self.log_queue.put_nowait, log_entry)
+        except Exception as e:
+            self.logger.warning("Error handling Windows event: %s", e)
     
     async def collect_logs(self) -> AsyncGenerator[RawLogEntry, None]:
         """Collect Windows Event logs"""
+        if self.subscriptions:
+            # Events are pushed into the queue by the EvtSubscribe callback
+            while self.running:
+                try:
+                    log_entry = await asyncio.wait_for(self.log_queue.get(), timeout=1.0)
+                    yield log_entry
+                except asyncio.TimeoutError:
+                    continue
+                except Exception as e:
+                    self.logger.error("Error collecting Windows Event logs: %s", e)
+                    break
+            return
+        
         while self.running:
             try:
-                for log_type in self.log_types:
-                    events = await self._fetch_new_events(log_type)
-                    for event_data in events:
-                        log_entry = self._create_log_entry(event_data, log_type)
-                        yield log_entry
+                now = datetime.now()  # Shared fallback timestamp for the batch
+                async for log_type, event_data, raw_line in self._fetch_new_events():
+                    log_entry = self._create_log_entry(event_data, log_type, now, raw_line)
+                    yield log_entry
                 
                 # Wait before next poll
                 await asyncio.sleep(self.poll_interval)
                 
             except Exception as e:
-                print(f"Error collecting Windows Event logs: {e}")
+                self.logger.error("Error collecting Windows Event logs: %s", e)
                 await asyncio.sleep(5)  # Wait before retrying
     
-    async def _get_latest_event_id(self, log_type: str) -> int:
-        """Get the latest event ID for a log type"""
+    def _log_names_literal(self) -> str:
+        """PowerShell array literal of the configured log names"""
+        return "@(" + ", ".join(f"'{log_type}'" for log_type in self.log_types) + ")"
+    
+    async def _stream_powershell(self, script: str) -> AsyncGenerator[Tuple[str, dict, bytes], None]:
+        """Run a PowerShell script emitting one compressed JSON record per line, yielding records as they arrive"""
+        result = await asyncio.create_subprocess_exec(
+            'powershell', '-Command', script,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=MAX_RECORD_SIZE
+        )
+        
         try:
-            # PowerShell command to get the latest event ID
-            cmd = [
-                'powershell', '-Command',
-                f"Get-WinEvent -LogName '{log_type}' -MaxEvents 1 | Select-Object -ExpandProperty Id"
-            ]
-            
-            result = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout, stderr = await result.communicate()
+            async for line in result.stdout:
+                line = line.strip()
+                if not line:
+                    continue
+                record = loads(line)
+                log_type = self._log_type_by_name.get(str(record.get('LogName', '')).lower())
+                if log_type:
+                    yield log_type, record, line
+        except BaseException:
+            # Abandoned part-way through: don't leave PowerShell running
+            try:
+                result.kill()
+            except ProcessLookupError:
+                pass  # Already exited
+            raise
+        finally:
+            await result.wait()
+    
+    async def _get_latest_event_ids(self) -> Dict[str, int]:
+        """Get the latest event ID for every log type in a single PowerShell call"""
+        latest_ids = {log_type: 0 for log_type in self.log_types}
+        try:
+            # PowerShell script to get the latest event ID per log
+            script = f"""
+            foreach ($log in {self._log_names_literal()}) {{
+                $event = Get-WinEvent -LogName $log -MaxEvents 1 -ErrorAction SilentlyContinue
+                [pscustomobject]@{{ LogName = $log; Id = if ($event) {{ $event.Id }} else {{ 0 }} }} |
+                ConvertTo-Json -Compress
+            }}
+            """
             
-            if result.returncode == 0 and stdout:
-                return int(stdout.decode().strip())
-            else:
-                return 0
+            async for log_type, record, _ in self._stream_powershell(script):
+                latest_ids[log_type] = int(record.get('Id') or 0)
         
         except Exception as e:
-            print(f"Error getting latest event ID for {log_type}: {e}")
-            return 0
+            self.logger.error("Error getting latest event IDs: %s", e)
+        
+        return latest_ids
     
-    async def _fetch_new_events(self, log_type: str) -> List[dict]:
-        """Fetch new events from Windows Event Log"""
+    async def _fetch_new_events(self) -> AsyncGenerator[Tuple[str, dict, bytes], None]:
+        """Stream new events for all log types from Windows Event Log out of a single PowerShell call"""
         try:
-            last_id = self.last_event_ids.get(log_type, 0)
-            
-            # PowerShell command to get events newer than last_id
-            cmd = [
-                'powershell', '-Command',
-                f"""
-                Get-WinEvent -LogName '{log_type}' -MaxEvents 100 | 
-                Where-Object {{ $_.Id -gt {last_id} }} | 
-                ConvertTo-Json -Depth 3
-                """
-            ]
-            
-            result = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+            last_ids = "; ".join(
+                f"'{log_type}' = {self.last_event_ids.get(log_type, 0)}" for log_type in self.log_types
             )
             
-            stdout, stderr = await result.communicate()
-            
-            if result.returncode == 0 and stdout:
-                output = stdout.decode().strip()
-                if output:
-                    # Parse JSON output
-                    events_data = json.loads(output)
-                    if isinstance(events_data, dict):
-                        events_data = [events_data]  # Single event
-                    
-                    # Update last event ID
-                    if events_data:
-                        max_id = max(event.get('Id', 0) for event in events_data)
-                        self.last_event_ids[log_type] = max_id
-                    
-                    return events_data
+            # PowerShell script to emit events newer than each log's last ID as NDJSON, tagged with LogName
+            script = f"""
+            $lastIds = @{{ {last_ids} }}
+            foreach ($log in {self._log_names_literal()}) {{
+                Get-WinEvent -LogName $log -MaxEvents 100 -ErrorAction SilentlyContinue |
+                Where-Object {{ $_.Id -gt $lastIds[$log] }} |
+                ForEach-Object {{ $_ | ConvertTo-Json -Compress -Depth 3 }}
+            }}
+            """
             
-            return []
+            async for log_type, event_data, raw_line in self._stream_powershell(script):
+                # Update last event ID per log type
+                event_id = event_data.get('Id', 0)
+                if event_id > self.last_event_ids.get(log_type, 0):
+                    self.last_event_ids[log_type] = event_id
+                yield log_type, event_data, raw_line
         
         except Exception as e:
-            print(f"Error fetching Windows events for {log_type}: {e}")
-            return []
+            self.logger.error("Error fetching Windows events: %s", e)
     
-    def _create_log_entry(self, event_data: dict, log_type: str) -> RawLogEntry:
+    def _create_log_entry(self, event_data: dict, log_type: str, now: Optional[datetime] = None,
+                          raw_line: Optional[bytes] = None) -> RawLogEntry:
         """Create RawLogEntry from Windows Event data"""
         # Extract relevant information from Windows Event
         event_id = event_data.get('Id', 0)
@@ -128,13 +244,14 @@ class WindowsEventCollector(BaseCollector):
         time_created = event_data.get('TimeCreated')
         
         # Parse timestamp
+        timestamp = None
         if time_created:
             try:
-                timestamp = datetime.fromisoformat(time_created.replace('Z', '+00:00'))
+                timestamp = _parse_event_time(time_created)
             except:
-                timestamp = datetime.now()
-        else:
-            timestamp = datetime.now()
+                pass
+        if timestamp is None:
+            timestamp = now or datetime.now()
         
         # Extract user and process information
         user = None
@@ -150,13 +267,19 @@ class WindowsEventCollector(BaseCollector):
         if process_id:
             process = f"PID:{process_id}"
         
+        # The log's own record number is unique per event; only fall back to the timestamp without it
+        record_id = event_data.get('RecordId')
+        if record_id is None:
+            record_id = int(timestamp.timestamp())
+        
         return RawLogEntry(
-            id=f"win_{log_type}_{event_id}_{int(timestamp.timestamp())}",
+            id=f"{self._id_prefix[log_type]}{event_id}_{record_id}",
             source=LogSource.WINDOWS_EVENT,
             timestamp=timestamp,
-            raw_data=json.dumps(event_data),
+            # Keep PowerShell's own JSON line when we have it rather than re-encoding the dict
+            raw_data=raw_line.decode('utf-8', errors='replace') if raw_line else dumps(event_data),
             user=user,
-            event_type=f"windows_{log_type.lower()}_{event_id}",
+            event_type=f"{self._event_type_prefix[log_type]}{event_id}",
             log_metadata={
                 'log_type': log_type,
                 'event_id': event_id,
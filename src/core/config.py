@@ -1,8 +1,23 @@
+import copy
 import os
+import re
 import yaml
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from pathlib import Path
 
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed YAML keyed by (path, mtime_ns), shared across Config instances
+_YAML_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+# ${VAR} references, substituted anywhere inside a string value
+_ENV_RE = re.compile(r'\$\{([^}]+)\}')
+
+def _env_value(match: re.Match) -> str:
+    """Replace a ${VAR} match with the variable's value, leaving it untouched if unset"""
+    return os.getenv(match.group(1), match.group(0))
+
 class Config:
     """Configuration manager for SIEM-Fusion"""
     
@@ -13,42 +28,55 @@ class Config:
         self.config_path = config_path
         self._config = self._load_config()
         self._substitute_env_vars()
+        self._flat = self._flatten(self._config)
     
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from YAML file"""
+        """Load configuration from YAML file, reusing the parse while the file is unchanged"""
         try:
-            with open(self.config_path, 'r') as file:
-                return yaml.safe_load(file)
+            key = (str(self.config_path), os.stat(self.config_path).st_mtime_ns)
+            if key not in _YAML_CACHE:
+                with open(self.config_path, 'r') as file:
+                    _YAML_CACHE[key] = yaml.load(file, Loader=_YAML_LOADER)
+            # Env var substitution mutates the tree in place, so hand out a copy
+            return copy.deepcopy(_YAML_CACHE[key])
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML configuration: {e}")
     
     def _substitute_env_vars(self):
-        """Substitute environment variables in configuration"""
-        def substitute_recursive(obj):
-            if isinstance(obj, dict):
-                return {k: substitute_recursive(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [substitute_recursive(item) for item in obj]
-            elif isinstance(obj, str) and obj.startswith("${") and obj.endswith("}"):
-                env_var = obj[2:-1]
-                return os.getenv(env_var, obj)
-            return obj
-        
-        self._config = substitute_recursive(self._config)
+        """Substitute environment variables in configuration, in place"""
+        stack = [self._config] if isinstance(self._config, (dict, list)) else []
+        while stack:
+            node = stack.pop()
+            items = node.items() if isinstance(node, dict) else enumerate(node)
+            for key, value in items:
+                if isinstance(value, str):
+                    if '${' in value:
+                        node[key] = _ENV_RE.sub(_env_value, value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+    
+    @staticmethod
+    def _flatten(config: Dict[str, Any]) -> Dict[str, Any]:
+        """Index every nested value by its dot-notation path, computed once at load"""
+        flat = {}
+        stack = [("", config)]
+        while stack:
+            prefix, node = stack.pop()
+            if not isinstance(node, dict):
+                continue
+            for key, value in node.items():
+                if not isinstance(key, str):
+                    continue
+                path = f"{prefix}{key}"
+                flat[path] = value
+                stack.append((f"{path}.", value))
+        return flat
     
     def get(self, key_path: str, default=None):
         """Get configuration value using dot notation (e.g., 'siem_fusion.llm_models.anomaly_detection')"""
-        keys = key_path.split('.')
-        value = self._config
-        
-        try:
-            for key in keys:
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
-            return default
+        return self._flat.get(key_path, default)
     
     def get_llm_config(self, model_name: str) -> Dict[str, Any]:
         """Get LLM configuration for a specific model"""
@@ -0,0 +1,22 @@
+import asyncio
+import sys
+from typing import Any, Coroutine
+
+if sys.platform == "win32":
+    try:
+        # winloop is the libuv-backed uvloop port for Windows, with the same API
+        import winloop as uvloop
+    except ImportError:
+        uvloop = None
+else:
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is optional (not available on free-threaded builds)
+        uvloop = None
+
+def run(main: Coroutine[Any, Any, Any]) -> Any:
+    """Run the main coroutine on uvloop/winloop when installed, else the stdlib loop"""
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
@@ -0,0 +1,23 @@
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_FORMAT = "%(asctime)s %(name)s %(message)s"
+
+def configure(level: int = logging.INFO) -> QueueListener:
+    """Route logging through an in-memory queue written out by a background thread"""
+    # Log calls on the event loop only enqueue the record; formatting and stdout writes happen off-loop
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    
+    records = queue.SimpleQueue()
+    listener = QueueListener(records, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)  # Flush whatever is still queued on exit
+    
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(QueueHandler(records))
+    return listener
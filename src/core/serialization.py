@@ -0,0 +1,28 @@
+import json
+from datetime import date, datetime
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+def _default(obj: Any) -> Any:
+    """Encode values JSON does not support natively"""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    return str(obj)
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize obj to a JSON string (indented by 2 spaces if indent), using orjson when installed"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=_default, option=option).decode()
+    return json.dumps(obj, default=_default, indent=2 if indent else None)
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document, using orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
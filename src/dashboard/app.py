@@ -1,267 +1,129 @@
 import dash
-from dash import dcc, html, Input, Output, State, dash_table, callback
+from dash import dcc, html, Input, Output, Patch, ctx, dash_table, callback
 import plotly.express as px
 import plotly.graph_objects as go
-import pandas as pd
+import plotly.io as pio
+import numpy as np
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta
+from functools import lru_cache
 import json
-from typing import List, Dict, Any
+import threading
+import time
+from typing import Dict, Any, Tuple
 
 from src.models.schemas import Alert, SeverityLevel, AlertStatus, ProcessingStats
 from src.core.config import config
+from src.core.serialization import orjson
+
+# Dash serializes callback responses through plotly's JSON encoder; pin it to orjson
+# when installed rather than re-detecting the engine on every response
+if orjson is not None:
+    pio.json.config.default_engine = "orjson"
+
+# Small integer codes for the columnar caches; severity codes follow display order.
+# The enums are str subclasses, so these also resolve the filters' plain string values.
+SEVERITY_CODES = {
+    SeverityLevel.CRITICAL: 0,
+    SeverityLevel.HIGH: 1,
+    SeverityLevel.MEDIUM: 2,
+    SeverityLevel.LOW: 3
+}
+SEVERITY_ORDER = tuple(severity.value for severity in SEVERITY_CODES)
+SEVERITY_NAMES = np.array(SEVERITY_ORDER)
+SEVERITY_COLORS = ('#c0392b', '#e67e22', '#f39c12', '#27ae60')
+ALERT_ACTIONS = "View | Investigate | Resolve"
+
+# Entity types summarized in the alerts table, with their display labels
+ENTITY_KEYS = (('ips', 'IPs'), ('users', 'Users'))
+
+# Memoized callback results kept, so clients with different filters don't evict each other
+RESULT_CACHE_SIZE = 16
+
+# Time-range filter values; anything else falls back to the last 24 hours
+TIME_WINDOWS = {
+    '1h': timedelta(hours=1),
+    '6h': timedelta(hours=6),
+    '24h': timedelta(hours=24),
+    '7d': timedelta(days=7)
+}
+STATUS_CODES = {status: code for code, status in enumerate(AlertStatus)}
+
+@lru_cache(maxsize=8)
+def _build_timeline_figure(hourly_counts: Tuple[Tuple[datetime, int, int], ...]):
+    """Build the timeline figure from (hour, severity code, count) rows; unchanged data reuses the figure"""
+    if not hourly_counts:
+        return go.Figure().add_annotation(
+            text="No alerts to display",
+            xref="paper", yref="paper",
+            x=0.5, y=0.5, xanchor='center', yanchor='middle',
+            showarrow=False, font_size=16
+        )
+    
+    fig = go.Figure()
+    
+    for code, (severity, color) in enumerate(zip(SEVERITY_ORDER, SEVERITY_COLORS)):
+        severity_data = [(hour, count) for hour, row_code, count in hourly_counts if row_code == code]
+        if severity_data:
+            # WebGL trace so long time ranges stay responsive
+            fig.add_trace(go.Scattergl(
+                x=[hour for hour, _ in severity_data],
+                y=[count for _, count in severity_data],
+                mode='lines+markers',
+                name=severity.title(),
+                line=dict(color=color),
+                marker=dict(color=color)
+            ))
+    
+    fig.update_layout(
+        title="Alert Timeline",
+        xaxis_title="Time",
+        yaxis_title="Number of Alerts",
+        height=300,
+        margin=dict(t=50, b=50, l=50, r=20),
+        showlegend=True
+    )
+    
+    return fig
 
 class SIEMDashboard:
     """SOC Dashboard for SIEM-Fusion alert presentation"""
     
     def __init__(self):
-        self.app = dash.Dash(__name__, external_stylesheets=[
+        # Custom CSS lives in soc_assets/, served by Dash as cacheable static files
+        self.app = dash.Dash(__name__, title="🛡️ SIEM-Fusion SOC Dashboard", assets_folder='soc_assets', external_stylesheets=[
             'https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css',
             'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css',
             'https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap'
         ])
         
-        # Add custom CSS
-        self.app.index_string = '''
-        <!DOCTYPE html>
-        <html>
-            <head>
-                {%metas%}
-                <title>🛡️ SIEM-Fusion SOC Dashboard</title>
-                {%favicon%}
-                {%css%}
-                <style>
-                    * {
-                        margin: 0;
-                        padding: 0;
-                        box-sizing: border-box;
-                    }
-                    
-                    body {
-                        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                        min-height: 100vh;
-                        color: #2c3e50;
-                    }
-                    
-                    .dashboard-container {
-                        background: rgba(255, 255, 255, 0.95);
-                        backdrop-filter: blur(20px);
-                        border-radius: 20px;
-                        margin: 20px;
-                        padding: 30px;
-                        box-shadow: 0 20px 40px rgba(0, 0, 0, 0.1);
-                        border: 1px solid rgba(255, 255, 255, 0.2);
-                    }
-                    
-                    .header {
-                        background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%);
-                        color: white;
-                        padding: 25px 30px;
-                        border-radius: 15px;
-                        margin-bottom: 30px;
-                        display: flex;
-                        justify-content: space-between;
-                        align-items: center;
-                        box-shadow: 0 10px 30px rgba(44, 62, 80, 0.3);
-                    }
-                    
-                    .header-title {
-                        font-size: 2.2em;
-                        font-weight: 700;
-                        margin: 0;
-                        display: flex;
-                        align-items: center;
-                        background: linear-gradient(45deg, #3498db, #2ecc71);
-                        -webkit-background-clip: text;
-                        -webkit-text-fill-color: transparent;
-                        background-clip: text;
-                    }
-                    
-                    .header-controls {
-                        display: flex;
-                        align-items: center;
-                        gap: 20px;
-                    }
-                    
-                    .refresh-btn {
-                        background: linear-gradient(135deg, #3498db, #2980b9);
-                        border: none;
-                        color: white;
-                        padding: 12px 24px;
-                        border-radius: 25px;
-                        cursor: pointer;
-                        font-weight: 600;
-                        transition: all 0.3s ease;
-                        box-shadow: 0 5px 15px rgba(52, 152, 219, 0.3);
-                    }
-                    
-                    .refresh-btn:hover {
-                        transform: translateY(-2px);
-                        box-shadow: 0 8px 25px rgba(52, 152, 219, 0.4);
-                    }
-                    
-                    .stats-row {
-                        display: grid;
-                        grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-                        gap: 20px;
-                        margin-bottom: 30px;
-                    }
-                    
-                    .stat-card {
-                        background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
-                        border-radius: 15px;
-                        padding: 25px;
-                        box-shadow: 0 10px 30px rgba(0, 0, 0, 0.08);
-                        border: 1px solid rgba(255, 255, 255, 0.8);
-                        transition: all 0.3s ease;
-                        position: relative;
-                        overflow: hidden;
-                    }
-                    
-                    .stat-card:hover {
-                        transform: translateY(-5px);
-                        box-shadow: 0 20px 40px rgba(0, 0, 0, 0.12);
-                    }
-                    
-                    .stat-card::before {
-                        content: '';
-                        position: absolute;
-                        top: 0;
-                        left: 0;
-                        right: 0;
-                        height: 4px;
-                        background: var(--card-color, #3498db);
-                    }
-                    
-                    .stat-content {
-                        display: flex;
-                        align-items: center;
-                        gap: 20px;
-                    }
-                    
-                    .stat-icon {
-                        font-size: 2.5em;
-                        opacity: 0.8;
-                    }
-                    
-                    .stat-text h3 {
-                        font-size: 2.5em;
-                        font-weight: 700;
-                        margin: 0;
-                        color: #2c3e50;
-                    }
-                    
-                    .stat-text p {
-                        font-size: 0.9em;
-                        color: #7f8c8d;
-                        margin: 5px 0 0 0;
-                        font-weight: 500;
-                        text-transform: uppercase;
-                        letter-spacing: 1px;
-                    }
-                    
-                    .charts-row {
-                        display: grid;
-                        grid-template-columns: 1fr 1fr;
-                        gap: 30px;
-                        margin-bottom: 30px;
-                    }
-                    
-                    .chart-container {
-                        background: white;
-                        border-radius: 15px;
-                        padding: 20px;
-                        box-shadow: 0 10px 30px rgba(0, 0, 0, 0.08);
-                        border: 1px solid rgba(255, 255, 255, 0.8);
-                    }
-                    
-                    .filters-row {
-                        display: grid;
-                        grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-                        gap: 20px;
-                        margin-bottom: 30px;
-                        background: white;
-                        padding: 25px;
-                        border-radius: 15px;
-                        box-shadow: 0 10px 30px rgba(0, 0, 0, 0.08);
-                    }
-                    
-                    .filter-group label {
-                        font-weight: 600;
-                        color: #2c3e50;
-                        margin-bottom: 8px;
-                        display: block;
-                    }
-                    
-                    .alerts-section {
-                        background: white;
-                        border-radius: 15px;
-                        padding: 30px;
-                        box-shadow: 0 10px 30px rgba(0, 0, 0, 0.08);
-                        border: 1px solid rgba(255, 255, 255, 0.8);
-                    }
-                    
-                    .alerts-section h3 {
-                        color: #2c3e50;
-                        font-weight: 700;
-                        margin-bottom: 20px;
-                        font-size: 1.5em;
-                    }
-                    
-                    .last-update {
-                        color: rgba(255, 255, 255, 0.8);
-                        font-size: 0.9em;
-                        font-weight: 500;
-                    }
-                    
-                    /* Responsive design */
-                    @media (max-width: 768px) {
-                        .charts-row {
-                            grid-template-columns: 1fr;
-                        }
-                        
-                        .header {
-                            flex-direction: column;
-                            gap: 15px;
-                            text-align: center;
-                        }
-                        
-                        .header-title {
-                            font-size: 1.8em;
-                        }
-                    }
-                    
-                    /* Animation for loading */
-                    @keyframes pulse {
-                        0% { opacity: 1; }
-                        50% { opacity: 0.5; }
-                        100% { opacity: 1; }
-                    }
-                    
-                    .loading {
-                        animation: pulse 2s infinite;
-                    }
-                </style>
-            </head>
-            <body>
-                {%app_entry%}
-                <footer>
-                    {%config%}
-                    {%scripts%}
-                    {%renderer%}
-                </footer>
-            </body>
-        </html>
-        '''
-        
         # Dashboard configuration
         self.refresh_interval = config.dashboard_config.get('refresh_interval', 10) * 1000  # Convert to ms
         self.max_alerts_display = config.dashboard_config.get('max_alerts_display', 50)
         
         # Mock data storage (in production, this would connect to a database)
-        self.alerts: List[Alert] = []
+        # Fixed-capacity ring buffer: the oldest alert is evicted in O(1) once full
+        capacity = self.max_alerts_display * 2
+        self.alerts = deque(maxlen=capacity)
         self.stats = ProcessingStats()
         
+        # Columnar copies of the fields the filters compare, preallocated ring slots
+        # parallel to self.alerts; empty slots hold NaT and never match the time filter
+        self._sev = np.zeros(capacity, dtype=np.int8)
+        self._stat = np.zeros(capacity, dtype=np.int8)
+        self._ts = np.full(capacity, np.datetime64('NaT'), dtype='datetime64[us]')
+        self._refs = np.empty(capacity, dtype=object)
+        self._display = np.empty(capacity, dtype=object)  # Table fields, formatted once per alert
+        self._next_slot = 0
+        self._size = 0
+        
+        # Bumped on every data change; keys the memoized callback results
+        self._version = 0
+        self._results = OrderedDict()
+        self._in_flight = {}  # Result key -> Event set once the request computing it finishes
+        # Serializes ring writes against callback reads, and concurrent identical refreshes
+        self._lock = threading.Lock()
+        
         self._setup_layout()
         self._setup_callbacks()
     
@@ -291,27 +153,22 @@ class SIEMDashboard:
                     n_intervals=0
                 ),
                 
+                # Latest counts; the stat cards are filled in from this client-side
+                dcc.Store(id='alerts-store'),
+                
                 # Statistics row with beautiful cards
                 html.Div([
-                    self._create_beautiful_stat_card("Total Alerts", "total-alerts", "fas fa-exclamation-triangle", "#e74c3c", "🚨"),
-                    self._create_beautiful_stat_card("Critical", "critical-alerts", "fas fa-fire", "#c0392b", "🔥"),
-                    self._create_beautiful_stat_card("High", "high-alerts", "fas fa-exclamation", "#e67e22", "⚠️"),
-                    self._create_beautiful_stat_card("Medium", "medium-alerts", "fas fa-info", "#f39c12", "📊"),
-                    self._create_beautiful_stat_card("Low", "low-alerts", "fas fa-check", "#27ae60", "✅")
-                ], className="stats-row"),
-                # Statistics row
-                html.Div([
-                    self._create_stat_card("Total Alerts", "total-alerts", "fas fa-exclamation-triangle", "#e74c3c"),
-                    self._create_stat_card("Critical", "critical-alerts", "fas fa-fire", "#c0392b"),
-                    self._create_stat_card("High", "high-alerts", "fas fa-exclamation", "#e67e22"),
-                    self._create_stat_card("Medium", "medium-alerts", "fas fa-info", "#f39c12"),
-                    self._create_stat_card("Low", "low-alerts", "fas fa-check", "#27ae60")
+                    self._create_beautiful_stat_card("Total Alerts", "total-alerts", "🚨", "#e74c3c"),
+                    self._create_beautiful_stat_card("Critical", "critical-alerts", "🔥", "#c0392b"),
+                    self._create_beautiful_stat_card("High", "high-alerts", "⚠️", "#e67e22"),
+                    self._create_beautiful_stat_card("Medium", "medium-alerts", "📊", "#f39c12"),
+                    self._create_beautiful_stat_card("Low", "low-alerts", "✅", "#27ae60")
                 ], className="stats-row"),
                 
                 # Charts row
                 html.Div([
                     html.Div([
-                        dcc.Graph(id="severity-chart")
+                        dcc.Graph(id="severity-chart", figure=self._create_severity_chart())
                     ], className="chart-container"),
                     html.Div([
                         dcc.Graph(id="timeline-chart")
@@ -373,123 +230,162 @@ class SIEMDashboard:
             ], className="main-content")
         ])
     
-    def _create_stat_card(self, title: str, id_suffix: str, icon: str, color: str):
-        """Create a statistics card"""
+    def _create_beautiful_stat_card(self, title: str, id_suffix: str, emoji: str, color: str):
+        """Create a beautiful statistics card with emoji and gradient"""
         return html.Div([
             html.Div([
-                html.I(className=icon, style={'color': color, 'font-size': '2em'}),
+                html.Span(emoji, className="stat-icon"),
                 html.Div([
-                    html.H3("0", id=f"stat-{id_suffix}"),
+                    html.H3("0", id=f"stat-{id_suffix}", style={'color': color}),
                     html.P(title)
                 ], className="stat-text")
             ], className="stat-content")
-        ], className="stat-card")
+        ], className="stat-card", style={'--card-color': color})
     
     def _setup_callbacks(self):
         """Setup dashboard callbacks"""
         
         @self.app.callback(
-            [Output('stat-total-alerts', 'children'),
-             Output('stat-critical-alerts', 'children'),
-             Output('stat-high-alerts', 'children'),
-             Output('stat-medium-alerts', 'children'),
-             Output('stat-low-alerts', 'children'),
+            [Output('alerts-store', 'data'),
              Output('severity-chart', 'figure'),
              Output('timeline-chart', 'figure'),
-             Output('alerts-table', 'children'),
-             Output('last-update', 'children')],
+             Output('alerts-table', 'children')],
             [Input('interval-component', 'n_intervals'),
-             Input('refresh-btn', 'n_clicks')],
-            [State('severity-filter', 'value'),
-             State('status-filter', 'value'),
-             State('time-filter', 'value')]
+             Input('refresh-btn', 'n_clicks'),
+             Input('severity-filter', 'value'),
+             Input('status-filter', 'value'),
+             Input('time-filter', 'value')]
         )
         def update_dashboard(n_intervals, refresh_clicks, severity_filter, status_filter, time_filter):
-            # Filter alerts based on selected criteria
-            filtered_alerts = self._filter_alerts(severity_filter, status_filter, time_filter)
-            
-            # Calculate statistics
-            total_alerts = len(filtered_alerts)
-            critical_count = len([a for a in filtered_alerts if a.severity == SeverityLevel.CRITICAL])
-            high_count = len([a for a in filtered_alerts if a.severity == SeverityLevel.HIGH])
-            medium_count = len([a for a in filtered_alerts if a.severity == SeverityLevel.MEDIUM])
-            low_count = len([a for a in filtered_alerts if a.severity == SeverityLevel.LOW])
-            
-            # Create charts
-            severity_chart = self._create_severity_chart(filtered_alerts)
-            timeline_chart = self._create_timeline_chart(filtered_alerts)
-            
-            # Create alerts table
-            alerts_table = self._create_alerts_table(filtered_alerts)
-            
-            # Last update timestamp
-            last_update = f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            # Filter changes apply immediately; an interval tick with nothing changed reuses the
+            # previous result. The minute bucket lets the relative time window's cutoff move forward,
+            # and the Refresh button always recomputes.
+            refresh = ctx.triggered_id == 'refresh-btn'
+            while True:
+                # The lock only guards the cache lookup and the snapshot of the ring buffer;
+                # the figures and table are built outside it
+                with self._lock:
+                    key = (severity_filter, status_filter, time_filter, self._version, int(time.time() // 60))
+                    if key in self._results and not refresh:
+                        self._results.move_to_end(key)
+                        return self._results[key]
+                    
+                    in_flight = self._in_flight.get(key)
+                    if in_flight is None:
+                        in_flight = self._in_flight[key] = threading.Event()
+                        snapshot = self._snapshot(severity_filter, status_filter, time_filter)
+                        break
+                
+                # Another request is computing this key; wait and reuse its fresh result
+                in_flight.wait()
+                refresh = False
             
-            return (
-                str(total_alerts), str(critical_count), str(high_count), 
-                str(medium_count), str(low_count),
-                severity_chart, timeline_chart, alerts_table, last_update
-            )
-    
-    def _filter_alerts(self, severity_filter: str, status_filter: str, time_filter: str) -> List[Alert]:
-        """Filter alerts based on selected criteria"""
-        filtered = self.alerts.copy()
+            try:
+                result = self._compute_dashboard(*snapshot)
+                with self._lock:
+                    self._results[key] = result
+                    if len(self._results) > RESULT_CACHE_SIZE:
+                        self._results.popitem(last=False)
+                return result
+            finally:
+                with self._lock:
+                    del self._in_flight[key]
+                in_flight.set()
         
-        # Filter by severity
-        if severity_filter != 'all':
-            filtered = [a for a in filtered if a.severity.value == severity_filter]
+        # Last update timestamp, from the browser clock (sv-SE renders as YYYY-MM-DD HH:MM:SS)
+        self.app.clientside_callback(
+            """
+            function(n_intervals, refresh_clicks) {
+                return 'Last updated: ' + new Date().toLocaleString('sv-SE');
+            }
+            """,
+            Output('last-update', 'children'),
+            [Input('interval-component', 'n_intervals'),
+             Input('refresh-btn', 'n_clicks')]
+        )
         
-        # Filter by status
-        if status_filter != 'all':
-            filtered = [a for a in filtered if a.status.value == status_filter]
+        # Format the stat cards in the browser from the compact store payload
+        self.app.clientside_callback(
+            """
+            function(stats) {
+                stats = stats || {};
+                return ['total', 'critical', 'high', 'medium', 'low'].map(function(key) {
+                    return String(stats[key] || 0);
+                });
+            }
+            """,
+            [Output('stat-total-alerts', 'children'),
+             Output('stat-critical-alerts', 'children'),
+             Output('stat-high-alerts', 'children'),
+             Output('stat-medium-alerts', 'children'),
+             Output('stat-low-alerts', 'children')],
+            Input('alerts-store', 'data')
+        )
+    
+    def _compute_dashboard(self, sev: np.ndarray, ts: np.ndarray, refs: np.ndarray, display: np.ndarray):
+        """Compute the stats payload, charts and table from a snapshot of the filtered alert columns"""
+        # Calculate statistics in a single pass over the filtered severities
+        counts = np.bincount(sev, minlength=len(SEVERITY_NAMES))
+        severity_counts = dict(zip(SEVERITY_NAMES.tolist(), counts.tolist()))
+        total_alerts = len(sev)
+        critical_count = severity_counts.get(SeverityLevel.CRITICAL.value, 0)
+        high_count = severity_counts.get(SeverityLevel.HIGH.value, 0)
+        medium_count = severity_counts.get(SeverityLevel.MEDIUM.value, 0)
+        low_count = severity_counts.get(SeverityLevel.LOW.value, 0)
         
-        # Filter by time range
-        now = datetime.now()
-        if time_filter == '1h':
-            cutoff = now - timedelta(hours=1)
-        elif time_filter == '6h':
-            cutoff = now - timedelta(hours=6)
-        elif time_filter == '24h':
-            cutoff = now - timedelta(hours=24)
-        elif time_filter == '7d':
-            cutoff = now - timedelta(days=7)
-        else:
-            cutoff = now - timedelta(hours=24)  # Default
+        # Create charts; the severity pie is patched in place rather than rebuilt
+        severity_chart = self._patch_severity_chart(severity_counts)
+        timeline_chart = self._create_timeline_chart(sev, ts)
         
-        filtered = [a for a in filtered if a.created_at > cutoff]
+        # Create alerts table
+        alerts_table = self._create_alerts_table(refs, display)
         
-        return filtered[:self.max_alerts_display]
-    
-    def _create_severity_chart(self, alerts: List[Alert]):
-        """Create severity distribution pie chart"""
-        if not alerts:
-            return go.Figure().add_annotation(
-                text="No alerts to display",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, xanchor='center', yanchor='middle',
-                showarrow=False, font_size=16
-            )
+        stats = {
+            'total': total_alerts, 'critical': critical_count, 'high': high_count,
+            'medium': medium_count, 'low': low_count
+        }
         
-        severity_counts = {}
-        for alert in alerts:
-            severity = alert.severity.value
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
+        return stats, severity_chart, timeline_chart, alerts_table
+    
+    def _filter_indices(self, severity_filter: str, status_filter: str, time_filter: str) -> np.ndarray:
+        """Positions in the columnar caches of the alerts matching the selected criteria"""
+        # Filter by time range
+        cutoff = datetime.now() - TIME_WINDOWS.get(time_filter, TIME_WINDOWS['24h'])
         
-        colors = {
-            'critical': '#c0392b',
-            'high': '#e67e22',
-            'medium': '#f39c12',
-            'low': '#27ae60'
-        }
+        # One vectorized mask over the columns instead of a list pass per criterion
+        mask = self._ts > np.datetime64(cutoff, 'us')
+        if severity_filter != 'all':
+            mask &= self._sev == SEVERITY_CODES.get(severity_filter, -1)
+        if status_filter != 'all':
+            mask &= self._stat == STATUS_CODES.get(status_filter, -1)
         
+        # Ring slots from oldest to newest, keeping only those that matched
+        capacity = len(self._ts)
+        slots = (self._next_slot - self._size + np.arange(self._size)) % capacity
+        return slots[mask[slots]][:self.max_alerts_display]
+    
+    def _snapshot(self, severity_filter: str, status_filter: str, time_filter: str) -> Tuple[np.ndarray, ...]:
+        """Copy the filtered alert columns out of the ring buffer; called with the lock held"""
+        indices = self._filter_indices(severity_filter, status_filter, time_filter)
+        return self._sev[indices], self._ts[indices], self._refs[indices], self._display[indices]
+    
+    def _create_severity_chart(self):
+        """Create the severity distribution pie chart, filled in by _patch_severity_chart"""
         fig = go.Figure(data=[go.Pie(
-            labels=list(severity_counts.keys()),
-            values=list(severity_counts.values()),
-            marker_colors=[colors.get(k, '#95a5a6') for k in severity_counts.keys()],
+            labels=[],
+            values=[],
+            marker_colors=[],
             textinfo='label+percent',
             textposition='inside'
         )])
         
+        fig.add_annotation(
+            text="No alerts to display",
+            xref="paper", yref="paper",
+            x=0.5, y=0.5, xanchor='center', yanchor='middle',
+            showarrow=False, font_size=16
+        )
+        
         fig.update_layout(
             title="Alert Severity Distribution",
             showlegend=True,
@@ -499,85 +395,76 @@ class SIEMDashboard:
         
         return fig
     
-    def _create_timeline_chart(self, alerts: List[Alert]):
-        """Create timeline chart of alerts"""
-        if not alerts:
-            return go.Figure().add_annotation(
-                text="No alerts to display",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, xanchor='center', yanchor='middle',
-                showarrow=False, font_size=16
-            )
-        
-        # Group alerts by hour
-        df = pd.DataFrame([{
-            'timestamp': alert.created_at,
-            'severity': alert.severity.value,
-            'count': 1
-        } for alert in alerts])
-        
-        df['hour'] = df['timestamp'].dt.floor('H')
-        hourly_counts = df.groupby(['hour', 'severity']).count().reset_index()
+    def _patch_severity_chart(self, severity_counts: Dict[str, int]) -> Patch:
+        """Partial update of the severity pie: only the trace data and the empty-state note change"""
+        present = [
+            (severity, color) for severity, color in zip(SEVERITY_ORDER, SEVERITY_COLORS)
+            if severity_counts.get(severity)
+        ]
+        labels = [severity for severity, _ in present]
         
-        colors = {
-            'critical': '#c0392b',
-            'high': '#e67e22',
-            'medium': '#f39c12',
-            'low': '#27ae60'
-        }
+        patch = Patch()
+        patch['data'][0]['labels'] = labels
+        patch['data'][0]['values'] = [severity_counts[severity] for severity in labels]
+        patch['data'][0]['marker']['colors'] = [color for _, color in present]
+        patch['layout']['annotations'][0]['visible'] = not labels
+        return patch
+    
+    def _create_timeline_chart(self, sev: np.ndarray, ts: np.ndarray):
+        """Create timeline chart from the filtered alerts' severity codes and timestamps"""
+        if not len(sev):
+            return _build_timeline_figure(())
         
-        fig = go.Figure()
+        # 2-D histogram over (hour bucket, severity) straight from the columns
+        hours, hour_idx = np.unique(ts.astype('datetime64[h]'), return_inverse=True)
+        counts = np.zeros((len(hours), len(SEVERITY_NAMES)), dtype=np.int64)
+        np.add.at(counts, (hour_idx, sev), 1)
         
-        for severity in ['critical', 'high', 'medium', 'low']:
-            severity_data = hourly_counts[hourly_counts['severity'] == severity]
-            if not severity_data.empty:
-                fig.add_trace(go.Scatter(
-                    x=severity_data['hour'],
-                    y=severity_data['count'],
-                    mode='lines+markers',
-                    name=severity.title(),
-                    line=dict(color=colors[severity]),
-                    marker=dict(color=colors[severity])
-                ))
+        # Hashable aggregate of the non-empty cells, so identical data maps to the cached figure
+        hour_pos, severity_pos = np.nonzero(counts)
+        return _build_timeline_figure(tuple(zip(
+            hours[hour_pos].tolist(),
+            severity_pos.tolist(),
+            counts[hour_pos, severity_pos].tolist()
+        )))
+    
+    def _format_alert(self, alert: Alert) -> Tuple[str, str, str, str, str, str]:
+        """Format an alert's table fields once, when it is added"""
+        # Get key entities for display
+        entities_str = "; ".join(
+            f"{label}: {', '.join(values[:2])}"
+            for key, label in ENTITY_KEYS if (values := alert.entities.get(key))
+        ) or "N/A"
         
-        fig.update_layout(
-            title="Alert Timeline",
-            xaxis_title="Time",
-            yaxis_title="Number of Alerts",
-            height=300,
-            margin=dict(t=50, b=50, l=50, r=20),
-            showlegend=True
+        return (
+            alert.id[:8] + "...",
+            alert.severity.value.upper(),
+            alert.status.value.upper(),
+            f"{alert.confidence:.2f}",
+            entities_str,
+            alert.created_at.strftime('%Y-%m-%d %H:%M')
         )
-        
-        return fig
     
-    def _create_alerts_table(self, alerts: List[Alert]):
-        """Create alerts data table"""
-        if not alerts:
+    def _create_alerts_table(self, refs: np.ndarray, display: np.ndarray):
+        """Create alerts data table from the filtered alerts and their pre-formatted fields"""
+        if not len(refs):
             return html.Div("No alerts to display", className="no-alerts")
         
-        # Prepare data for table
-        table_data = []
-        for alert in alerts:
-            # Get key entities for display
-            entities_summary = []
-            if alert.entities.get('ips'):
-                entities_summary.append(f"IPs: {', '.join(alert.entities['ips'][:2])}")
-            if alert.entities.get('users'):
-                entities_summary.append(f"Users: {', '.join(alert.entities['users'][:2])}")
-            
-            entities_str = "; ".join(entities_summary) if entities_summary else "N/A"
-            
-            table_data.append({
-                'ID': alert.id[:8] + "...",
+        # Prepare data for table from the pre-formatted fields, one dict per row
+        table_data = [
+            {
+                'ID': short_id,
                 'Title': alert.title,
-                'Severity': alert.severity.value.upper(),
-                'Status': alert.status.value.upper(),
-                'Confidence': f"{alert.confidence:.2f}",
+                'Severity': severity,
+                'Status': status,
+                'Confidence': confidence,
                 'Entities': entities_str,
-                'Created': alert.created_at.strftime('%Y-%m-%d %H:%M'),
-                'Actions': "View | Investigate | Resolve"
-            })
+                'Created': created,
+                'Actions': ALERT_ACTIONS
+            }
+            for alert, (short_id, severity, status, confidence, entities_str, created)
+            in zip(refs, display)
+        ]
         
         # Define column styling
         columns = [
@@ -621,21 +508,35 @@ class SIEMDashboard:
                     'fontWeight': 'bold'
                 }
             ],
-            page_size=20,
+            # Render only the rows in view instead of building DOM for every row
+            virtualization=True,
+            fixed_rows={'headers': True},
+            page_action='none',
+            style_table={'height': '500px', 'overflowY': 'auto'},
             sort_action="native",
             filter_action="native"
         )
     
     def add_alert(self, alert: Alert):
         """Add a new alert to the dashboard"""
-        self.alerts.append(alert)
-        # Keep only recent alerts to prevent memory issues
-        if len(self.alerts) > self.max_alerts_display * 2:
-            self.alerts = self.alerts[-self.max_alerts_display:]
+        display = self._format_alert(alert)
+        # Keep only recent alerts to prevent memory issues; the deque and ring slots evict the oldest
+        with self._lock:
+            self.alerts.append(alert)
+            slot = self._next_slot
+            self._sev[slot] = SEVERITY_CODES[alert.severity]
+            self._stat[slot] = STATUS_CODES[alert.status]
+            self._ts[slot] = np.datetime64(alert.created_at, 'us')
+            self._refs[slot] = alert
+            self._display[slot] = display
+            self._next_slot = (slot + 1) % len(self._ts)
+            self._size = min(self._size + 1, len(self._ts))
+            self._version += 1
     
     def update_stats(self, stats: ProcessingStats):
         """Update processing statistics"""
         self.stats = stats
+        self._version += 1
     
     def run(self, host: str = None, port: int = None, debug: bool = False):
         """Run the dashboard server"""
@@ -0,0 +1,116 @@
+// Clientside callbacks for the SIEM-Fusion SOC dashboard.
+// The server only sends counts and hour buckets; the stat cards and figures are filled in here.
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    siem: {
+        backOffInterval: function(nIntervals, stats, state) {
+            // Stats seen at this tick equal the previous tick's means the last refresh changed nothing
+            var hash = JSON.stringify(stats);
+            var current = state.interval || state.base;
+            var next = (state.hash !== undefined && hash === state.hash)
+                ? Math.min(current * 2, state.max)
+                : state.base;
+
+            var newState = Object.assign({}, state, {hash: hash, interval: next});
+            return [next === current ? window.dash_clientside.no_update : next, newState];
+        },
+
+        fanOutStats: function(stats) {
+            if (!stats) {
+                return window.dash_clientside.no_update;
+            }
+
+            // One value per stat card, matched on the card's id suffix
+            var outputs = window.dash_clientside.callback_context.outputs_list;
+            return outputs.map(function(output) {
+                return String(stats[output.id.idx]);
+            });
+        },
+
+        makeSeverity: function(data) {
+            if (!data) {
+                return window.dash_clientside.no_update;
+            }
+
+            // Dynamic title based on filter
+            var filter = data.filter;
+            var chartTitle = (filter && filter !== 'ALL')
+                ? '🎯 ' + filter + ' Alerts Distribution'
+                : '🎯 Alert Severity Distribution';
+
+            return {
+                data: [{
+                    type: 'pie',
+                    labels: ['Critical', 'High', 'Medium', 'Low'],
+                    values: data.counts,
+                    marker: {colors: ['#c0392b', '#e67e22', '#f39c12', '#27ae60']},
+                    textinfo: 'label+percent+value',
+                    textposition: 'inside',
+                    hole: 0.4
+                }],
+                layout: {
+                    title: {
+                        text: chartTitle,
+                        font: {size: 12, color: '#2c3e50', family: 'Inter'},
+                        x: 0.5
+                    },
+                    showlegend: true,
+                    height: 235,
+                    margin: {t: 40, b: 13, l: 13, r: 13},
+                    paper_bgcolor: 'rgba(0,0,0,0)',
+                    plot_bgcolor: 'rgba(0,0,0,0)'
+                }
+            };
+        },
+
+        makeTimeline: function(data, figure) {
+            if (!data) {
+                return window.dash_clientside.no_update;
+            }
+
+            var series = [
+                ['critical', '🔥 Critical', '#c0392b'],
+                ['high', '⚠️ High', '#e67e22'],
+                ['medium', '📊 Medium', '#f39c12']
+            ];
+
+            // Once the traces exist, only swap their x/y arrays instead of replacing the figure
+            if (figure && figure.data && figure.data.length === series.length) {
+                var patch = new window.dash_clientside.Patch();
+                series.forEach(function(s, i) {
+                    patch.assign(['data', i, 'x'], data.hours);
+                    patch.assign(['data', i, 'y'], data[s[0]]);
+                });
+                return patch.build();
+            }
+
+            return {
+                data: series.map(function(s) {
+                    return {
+                        // WebGL trace so live refreshes stay off the SVG rebuild path
+                        type: 'scattergl',
+                        x: data.hours,
+                        y: data[s[0]],
+                        mode: 'lines+markers',
+                        name: s[1],
+                        line: {color: s[2], width: 3},
+                        marker: {size: 8, color: s[2]}
+                    };
+                }),
+                layout: {
+                    title: {
+                        text: '📈 24-Hour Alert Timeline',
+                        font: {size: 12, color: '#2c3e50', family: 'Inter'},
+                        x: 0.5
+                    },
+                    xaxis: {title: {text: '⏰ Time'}, gridcolor: 'rgba(0,0,0,0.1)'},
+                    yaxis: {title: {text: '📊 Alert Count'}, gridcolor: 'rgba(0,0,0,0.1)'},
+                    height: 235,
+                    margin: {t: 40, b: 33, l: 33, r: 13},
+                    showlegend: true,
+                    paper_bgcolor: 'rgba(0,0,0,0)',
+                    plot_bgcolor: 'rgba(0,0,0,0)'
+                }
+            };
+        }
+    }
+});
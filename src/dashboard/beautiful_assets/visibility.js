@@ -0,0 +1,7 @@
+// Pause the dashboard's polling interval while the browser tab is hidden,
+// so background tabs stop triggering server refreshes.
+document.addEventListener('visibilitychange', function() {
+    if (window.dash_clientside && window.dash_clientside.set_props) {
+        window.dash_clientside.set_props('interval-component', {disabled: document.hidden});
+    }
+});
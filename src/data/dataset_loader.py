@@ -4,11 +4,12 @@ Loads and processes security datasets from CSV files
 """
 
 import pandas as pd
+import numpy as np
 import os
 import json
-import uuid
+import binascii
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Generator
+from typing import Dict, List, Any, Optional, Generator, AsyncGenerator
 from pathlib import Path
 import asyncio
 import logging
@@ -16,6 +17,13 @@ import logging
 from src.database.models import LogEntry
 from src.core.config import config
 
+# Rows parsed per read_csv chunk; bounds memory for large datasets
+CSV_CHUNK_ROWS = 10_000
+
+# Dataset files processed at once, and entries buffered ahead of the consumer
+MAX_CONCURRENT_FILES = os.cpu_count() or 4
+DATASET_QUEUE_SIZE = 1000
+
 class DatasetLoader:
     """Loads security datasets from CSV files and converts to LogEntry format"""
     
@@ -49,7 +57,8 @@ class DatasetLoader:
         """Load all available datasets and yield LogEntry objects"""
         self.logger.info("🔄 Starting dataset loading...")
         
-        total_entries = 0
+        # Collect every (processor, file) pair up front so the files can run concurrently
+        jobs = []
         for category, subcategories in self.dataset_configs.items():
             category_path = self.datasets_path / category
             
@@ -66,169 +75,264 @@ class DatasetLoader:
                 
                 # Process all CSV files in the subcategory
                 for csv_file in subcategory_path.glob("*.csv"):
-                    self.logger.info(f"📊 Processing dataset: {csv_file}")
-                    
-                    try:
-                        async for log_entry in processor_func(csv_file):
-                            total_entries += 1
-                            yield log_entry
-                            
-                            # Add small delay to prevent overwhelming the system
-                            if total_entries % 100 == 0:
-                                await asyncio.sleep(0.1)
-                                
-                    except Exception as e:
-                        self.logger.error(f"❌ Error processing {csv_file}: {e}")
+                    jobs.append((processor_func, csv_file))
+        
+        # Bounded queue: producers block once the consumer falls behind
+        queue = asyncio.Queue(maxsize=DATASET_QUEUE_SIZE)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FILES)
+        
+        async def run(processor_func, csv_file):
+            async with semaphore:
+                self.logger.info(f"📊 Processing dataset: {csv_file}")
+                
+                try:
+                    async for log_entry in processor_func(csv_file):
+                        await queue.put(log_entry)
+                        
+                except Exception as e:
+                    self.logger.error(f"❌ Error processing {csv_file}: {e}")
+        
+        async def run_all():
+            await asyncio.gather(*(run(processor_func, csv_file) for processor_func, csv_file in jobs))
+            await queue.put(None)
+        
+        producer = asyncio.create_task(run_all())
+        total_entries = 0
+        try:
+            while (log_entry := await queue.get()) is not None:
+                total_entries += 1
+                yield log_entry
+        finally:
+            # Stop the remaining files if the consumer stops early
+            producer.cancel()
         
         self.logger.info(f"✅ Dataset loading complete. Total entries: {total_entries}")
     
+    async def load_all_datasets_batched(self, size: int = 256) -> AsyncGenerator[List[LogEntry], None]:
+        """Load all available datasets and yield lists of up to `size` LogEntry objects"""
+        batch = []
+        async for log_entry in self.load_all_datasets():
+            batch.append(log_entry)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        
+        if batch:
+            yield batch
+    
+    async def _read_chunks(self, csv_file: Path) -> AsyncGenerator[pd.DataFrame, None]:
+        """Yield the CSV in chunks, parsing each one on a worker thread"""
+        reader = await asyncio.to_thread(pd.read_csv, csv_file, chunksize=CSV_CHUNK_ROWS)
+        with reader:
+            while (df := await asyncio.to_thread(next, reader, None)) is not None:
+                yield df
+    
     async def _process_cicids2017(self, csv_file: Path) -> Generator[LogEntry, None, None]:
         """Process CICIDS2017 network traffic dataset"""
-        df = pd.read_csv(csv_file)
-        
-        for _, row in df.iterrows():
-            log_entry = LogEntry(
-                id=str(uuid.uuid4()),
-                source="CICIDS2017",
-                timestamp=pd.to_datetime(row['timestamp']),
-                event_type="network_traffic",
-                source_ip=row['src_ip'],
-                destination_ip=row['dst_ip'],
-                port=row['src_port'],
-                protocol=row['protocol'],
-                message=f"Network flow: {row['src_ip']}:{row['src_port']} -> {row['dst_ip']}:{row['dst_port']}",
-                severity=self._determine_severity(row.get('label', 'BENIGN')),
-                raw_data=row.to_dict(),
-                log_metadata={
-                    "flow_duration": row.get('flow_duration', 0),
-                    "total_fwd_packets": row.get('total_fwd_packets', 0),
-                    "total_bwd_packets": row.get('total_bwd_packets', 0),
-                    "flow_bytes_per_sec": row.get('flow_bytes_per_sec', 0),
-                    "packet_length_mean": row.get('packet_length_mean', 0),
-                    "label": row.get('label', 'BENIGN')
-                }
-            )
-            yield log_entry
+        # Stream the file in chunks rather than materializing it whole
+        async for df in self._read_chunks(csv_file):
+            # Severity for the whole column at once; the loop only picks up each row's value
+            severities = self._determine_severity(self._column(df, 'label', 'BENIGN'))
+            
+            # IDs and messages for the whole chunk, built column-wise
+            ids = self._new_ids(len(df))
+            messages = (
+                "Network flow: " + self._text(df['src_ip']) + ":" + self._text(df['src_port'])
+                + " -> " + self._text(df['dst_ip']) + ":" + self._text(df['dst_port'])
+            ).tolist()
+            
+            # Parse the timestamp column once; repeated values share one parse
+            timestamps = pd.to_datetime(df['timestamp'], cache=True).tolist()
+            
+            # Metadata dicts for the whole chunk in one conversion; defaults only fill columns the file lacks
+            metas = self._records(df, {
+                "flow_duration": ('flow_duration', 0),
+                "total_fwd_packets": ('total_fwd_packets', 0),
+                "total_bwd_packets": ('total_bwd_packets', 0),
+                "flow_bytes_per_sec": ('flow_bytes_per_sec', 0),
+                "packet_length_mean": ('packet_length_mean', 0),
+                "label": ('label', 'BENIGN')
+            })
+            
+            # Plain tuples for field access and one bulk dict conversion for raw_data, instead of a Series per row
+            entries = zip(ids, df.itertuples(index=False), df.to_dict(orient='records'), severities, timestamps, messages, metas)
+            for log_id, row, record, severity, timestamp, message, meta in entries:
+                log_entry = LogEntry(
+                    id=log_id,
+                    source="CICIDS2017",
+                    timestamp=timestamp,
+                    event_type="network_traffic",
+                    source_ip=row.src_ip,
+                    destination_ip=row.dst_ip,
+                    port=row.src_port,
+                    protocol=row.protocol,
+                    message=message,
+                    severity=severity,
+                    raw_data=record,
+                    log_metadata=meta
+                )
+                yield log_entry
     
     async def _process_unsw_nb15(self, csv_file: Path) -> Generator[LogEntry, None, None]:
         """Process UNSW-NB15 attack patterns dataset"""
-        df = pd.read_csv(csv_file)
-        
-        for _, row in df.iterrows():
-            log_entry = LogEntry(
-                id=str(uuid.uuid4()),
-                source="UNSW-NB15",
-                timestamp=datetime.now(),
-                event_type="network_attack",
-                protocol=row.get('proto', 'unknown'),
-                port=row.get('service', 'unknown'),
-                message=f"Network connection: {row.get('proto', 'unknown')} service={row.get('service', 'unknown')} state={row.get('state', 'unknown')}",
-                severity=self._determine_severity_by_attack(row.get('attack_cat', 'Normal')),
-                raw_data=row.to_dict(),
-                log_metadata={
-                    "duration": row.get('dur', 0),
-                    "src_packets": row.get('spkts', 0),
-                    "dst_packets": row.get('dpkts', 0),
-                    "src_bytes": row.get('sbytes', 0),
-                    "dst_bytes": row.get('dbytes', 0),
-                    "attack_category": row.get('attack_cat', 'Normal'),
-                    "label": row.get('label', 0)
-                }
-            )
-            yield log_entry
+        async for df in self._read_chunks(csv_file):
+            severities = self._determine_severity_by_attack(self._column(df, 'attack_cat', 'Normal'))
+            ids = self._new_ids(len(df))
+            messages = (
+                "Network connection: " + self._text(self._column(df, 'proto', 'unknown'))
+                + " service=" + self._text(self._column(df, 'service', 'unknown'))
+                + " state=" + self._text(self._column(df, 'state', 'unknown'))
+            ).tolist()
+            
+            metas = self._records(df, {
+                "duration": ('dur', 0),
+                "src_packets": ('spkts', 0),
+                "dst_packets": ('dpkts', 0),
+                "src_bytes": ('sbytes', 0),
+                "dst_bytes": ('dbytes', 0),
+                "attack_category": ('attack_cat', 'Normal'),
+                "label": ('label', 0)
+            })
+            
+            entries = zip(ids, df.itertuples(index=False), df.to_dict(orient='records'), severities, messages, metas)
+            for log_id, row, record, severity, message, meta in entries:
+                log_entry = LogEntry(
+                    id=log_id,
+                    source="UNSW-NB15",
+                    timestamp=datetime.now(),
+                    event_type="network_attack",
+                    protocol=getattr(row, 'proto', 'unknown'),
+                    port=getattr(row, 'service', 'unknown'),
+                    message=message,
+                    severity=severity,
+                    raw_data=record,
+                    log_metadata=meta
+                )
+                yield log_entry
     
     async def _process_windows_security(self, csv_file: Path) -> Generator[LogEntry, None, None]:
         """Process Windows Security Event logs"""
-        df = pd.read_csv(csv_file)
-        
-        for _, row in df.iterrows():
-            log_entry = LogEntry(
-                id=str(uuid.uuid4()),
-                source="Windows Security",
-                timestamp=pd.to_datetime(row['TimeGenerated']),
-                event_type=f"windows_event_{row['EventID']}",
-                user=row.get('Account_Name', 'unknown'),
-                source_ip=row.get('Source_Network_Address', ''),
-                process=row.get('Process_Name', ''),
-                message=f"EventID {row['EventID']}: {row.get('Event_Description', 'Windows security event')}",
-                severity=self._map_windows_severity(row.get('Severity', 'Information')),
-                raw_data=row.to_dict(),
-                log_metadata={
-                    "event_id": row['EventID'],
-                    "computer": row.get('Computer', ''),
-                    "account_domain": row.get('Account_Domain', ''),
-                    "logon_type": row.get('Logon_Type', ''),
-                    "process_id": row.get('Process_ID', ''),
-                    "security_id": row.get('Security_ID', '')
-                }
-            )
-            yield log_entry
+        async for df in self._read_chunks(csv_file):
+            severities = self._map_windows_severity(self._column(df, 'Severity', 'Information'))
+            ids = self._new_ids(len(df))
+            event_ids = self._text(df['EventID'])
+            event_types = ("windows_event_" + event_ids).tolist()
+            messages = (
+                "EventID " + event_ids + ": " + self._text(self._column(df, 'Event_Description', 'Windows security event'))
+            ).tolist()
+            timestamps = pd.to_datetime(df['TimeGenerated'], cache=True).tolist()
+            
+            metas = self._records(df, {
+                "event_id": 'EventID',
+                "computer": ('Computer', ''),
+                "account_domain": ('Account_Domain', ''),
+                "logon_type": ('Logon_Type', ''),
+                "process_id": ('Process_ID', ''),
+                "security_id": ('Security_ID', '')
+            })
+            
+            entries = zip(ids, df.itertuples(index=False), df.to_dict(orient='records'), severities, event_types, timestamps, messages, metas)
+            for log_id, row, record, severity, event_type, timestamp, message, meta in entries:
+                log_entry = LogEntry(
+                    id=log_id,
+                    source="Windows Security",
+                    timestamp=timestamp,
+                    event_type=event_type,
+                    user=getattr(row, 'Account_Name', 'unknown'),
+                    source_ip=getattr(row, 'Source_Network_Address', ''),
+                    process=getattr(row, 'Process_Name', ''),
+                    message=message,
+                    severity=severity,
+                    raw_data=record,
+                    log_metadata=meta
+                )
+                yield log_entry
     
     async def _process_android_malware(self, csv_file: Path) -> Generator[LogEntry, None, None]:
         """Process Android malware analysis dataset"""
-        df = pd.read_csv(csv_file)
-        
-        for _, row in df.iterrows():
-            log_entry = LogEntry(
-                id=str(uuid.uuid4()),
-                source="Android Malware Analysis",
-                timestamp=pd.to_datetime(row.get('detection_date', datetime.now())),
-                event_type="malware_detection",
-                user=row.get('package_name', 'unknown'),
-                file_path=row.get('package_name', ''),
-                message=f"Malware detected: {row.get('app_name', 'Unknown')} - {row.get('malware_family', 'Unknown')}",
-                severity=self._map_threat_level(row.get('threat_level', 'Medium')),
-                raw_data=row.to_dict(),
-                log_metadata={
-                    "package_name": row.get('package_name', ''),
-                    "app_name": row.get('app_name', ''),
-                    "version_name": row.get('version_name', ''),
-                    "file_size": row.get('file_size', 0),
-                    "md5_hash": row.get('md5_hash', ''),
-                    "sha256_hash": row.get('sha256_hash', ''),
-                    "permissions": row.get('permissions', ''),
-                    "malware_family": row.get('malware_family', ''),
-                    "threat_level": row.get('threat_level', ''),
-                    "behavior_analysis": row.get('behavior_analysis', ''),
-                    "classification": row.get('classification', '')
-                }
-            )
-            yield log_entry
+        async for df in self._read_chunks(csv_file):
+            severities = self._map_threat_level(self._column(df, 'threat_level', 'Medium'))
+            ids = self._new_ids(len(df))
+            messages = (
+                "Malware detected: " + self._text(self._column(df, 'app_name', 'Unknown'))
+                + " - " + self._text(self._column(df, 'malware_family', 'Unknown'))
+            ).tolist()
+            timestamps = pd.to_datetime(self._column(df, 'detection_date', datetime.now()), cache=True).tolist()
+            
+            metas = self._records(df, {
+                "package_name": ('package_name', ''),
+                "app_name": ('app_name', ''),
+                "version_name": ('version_name', ''),
+                "file_size": ('file_size', 0),
+                "md5_hash": ('md5_hash', ''),
+                "sha256_hash": ('sha256_hash', ''),
+                "permissions": ('permissions', ''),
+                "malware_family": ('malware_family', ''),
+                "threat_level": ('threat_level', ''),
+                "behavior_analysis": ('behavior_analysis', ''),
+                "classification": ('classification', '')
+            })
+            
+            entries = zip(ids, df.itertuples(index=False), df.to_dict(orient='records'), severities, timestamps, messages, metas)
+            for log_id, row, record, severity, timestamp, message, meta in entries:
+                log_entry = LogEntry(
+                    id=log_id,
+                    source="Android Malware Analysis",
+                    timestamp=timestamp,
+                    event_type="malware_detection",
+                    user=getattr(row, 'package_name', 'unknown'),
+                    file_path=getattr(row, 'package_name', ''),
+                    message=message,
+                    severity=severity,
+                    raw_data=record,
+                    log_metadata=meta
+                )
+                yield log_entry
     
     async def _process_firewall_logs(self, csv_file: Path) -> Generator[LogEntry, None, None]:
         """Process firewall syslog events"""
-        df = pd.read_csv(csv_file)
-        
-        for _, row in df.iterrows():
-            log_entry = LogEntry(
-                id=str(uuid.uuid4()),
-                source="Firewall",
-                timestamp=pd.to_datetime(row['timestamp']),
-                event_type="firewall_event",
-                source_ip=row.get('src_ip', ''),
-                destination_ip=row.get('dst_ip', ''),
-                port=row.get('src_port', 0),
-                protocol=row.get('protocol', ''),
-                message=f"Firewall {row.get('action', 'UNKNOWN')}: {row.get('message', 'Firewall event')}",
-                severity=self._map_firewall_severity(row.get('severity', 6)),
-                raw_data=row.to_dict(),
-                log_metadata={
-                    "facility": row.get('facility', 16),
-                    "hostname": row.get('hostname', ''),
-                    "process": row.get('process', ''),
-                    "action": row.get('action', ''),
-                    "rule_id": row.get('rule_id', 0),
-                    "bytes_in": row.get('bytes_in', 0),
-                    "bytes_out": row.get('bytes_out', 0),
-                    "session_id": row.get('session_id', ''),
-                    "interface": row.get('interface', ''),
-                    "zone_src": row.get('zone_src', ''),
-                    "zone_dst": row.get('zone_dst', ''),
-                    "threat_type": row.get('threat_type', ''),
-                    "signature_id": row.get('signature_id', 0)
-                }
-            )
-            yield log_entry
+        async for df in self._read_chunks(csv_file):
+            severities = self._map_firewall_severity(self._column(df, 'severity', 6))
+            ids = self._new_ids(len(df))
+            messages = (
+                "Firewall " + self._text(self._column(df, 'action', 'UNKNOWN'))
+                + ": " + self._text(self._column(df, 'message', 'Firewall event'))
+            ).tolist()
+            timestamps = pd.to_datetime(df['timestamp'], cache=True).tolist()
+            
+            metas = self._records(df, {
+                "facility": ('facility', 16),
+                "hostname": ('hostname', ''),
+                "process": ('process', ''),
+                "action": ('action', ''),
+                "rule_id": ('rule_id', 0),
+                "bytes_in": ('bytes_in', 0),
+                "bytes_out": ('bytes_out', 0),
+                "session_id": ('session_id', ''),
+                "interface": ('interface', ''),
+                "zone_src": ('zone_src', ''),
+                "zone_dst": ('zone_dst', ''),
+                "threat_type": ('threat_type', ''),
+                "signature_id": ('signature_id', 0)
+            })
+            
+            entries = zip(ids, df.itertuples(index=False), df.to_dict(orient='records'), severities, timestamps, messages, metas)
+            for log_id, row, record, severity, timestamp, message, meta in entries:
+                log_entry = LogEntry(
+                    id=log_id,
+                    source="Firewall",
+                    timestamp=timestamp,
+                    event_type="firewall_event",
+                    source_ip=getattr(row, 'src_ip', ''),
+                    destination_ip=getattr(row, 'dst_ip', ''),
+                    port=getattr(row, 'src_port', 0),
+                    protocol=getattr(row, 'protocol', ''),
+                    message=message,
+                    severity=severity,
+                    raw_data=record,
+                    log_metadata=meta
+                )
+                yield log_entry
     
     # Placeholder methods for other dataset types
     async def _process_nsl_kdd(self, csv_file: Path) -> Generator[LogEntry, None, None]:
@@ -257,28 +361,43 @@ class DatasetLoader:
         return
         yield  # Make it a generator
     
-    def _determine_severity(self, label: str) -> str:
+    def _column(self, df: pd.DataFrame, name: str, default: Any) -> pd.Series:
+        """Return a column of df, or default for every row when the file lacks it"""
+        return df[name] if name in df.columns else pd.Series(default, index=df.index)
+    
+    def _new_ids(self, count: int) -> List[str]:
+        """Random 32-char hex IDs from one urandom read and one hexlify, rather than a uuid4 per row"""
+        hex_ids = binascii.hexlify(os.urandom(16 * count)).decode()
+        return [hex_ids[i:i + 32] for i in range(0, 32 * count, 32)]
+    
+    def _records(self, df: pd.DataFrame, fields: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Convert df to one dict per row, where each field is a column name or a (column, default) pair"""
+        columns = {
+            key: df[spec] if isinstance(spec, str) else self._column(df, *spec)
+            for key, spec in fields.items()
+        }
+        return pd.DataFrame(columns).to_dict(orient='records')
+    
+    def _text(self, values: pd.Series) -> pd.Series:
+        """Render a column as strings, with missing values as 'nan' like str() does"""
+        return values.astype(str).fillna('nan')
+    
+    def _determine_severity(self, labels: pd.Series) -> List[str]:
         """Determine severity based on traffic label"""
-        if label.upper() == 'BENIGN':
-            return 'info'
-        else:
-            return 'high'  # Any non-benign traffic is high severity
+        # Any non-benign traffic is high severity
+        return np.where(labels.astype(str).str.upper() == 'BENIGN', 'info', 'high').tolist()
     
-    def _determine_severity_by_attack(self, attack_cat: str) -> str:
+    def _determine_severity_by_attack(self, attack_cats: pd.Series) -> List[str]:
         """Determine severity based on attack category"""
         high_severity = ['DoS', 'Exploits', 'Backdoor', 'Rootkit']
         medium_severity = ['Reconnaissance', 'Fuzzers', 'Analysis']
         
-        if attack_cat in high_severity:
-            return 'critical'
-        elif attack_cat in medium_severity:
-            return 'medium'
-        elif attack_cat == 'Normal':
-            return 'info'
-        else:
-            return 'high'
+        mapping = {attack_cat: 'critical' for attack_cat in high_severity}
+        mapping.update({attack_cat: 'medium' for attack_cat in medium_severity})
+        mapping['Normal'] = 'info'
+        return attack_cats.map(mapping).fillna('high').tolist()
     
-    def _map_windows_severity(self, severity: str) -> str:
+    def _map_windows_severity(self, severities: pd.Series) -> List[str]:
         """Map Windows event severity to standard levels"""
         mapping = {
             'Information': 'info',
@@ -286,9 +405,9 @@ class DatasetLoader:
             'Error': 'high',
             'Critical': 'critical'
         }
-        return mapping.get(severity, 'medium')
+        return severities.map(mapping).fillna('medium').tolist()
     
-    def _map_threat_level(self, threat_level: str) -> str:
+    def _map_threat_level(self, threat_levels: pd.Series) -> List[str]:
         """Map malware threat level to severity"""
         mapping = {
             'Low': 'low',
@@ -296,19 +415,17 @@ class DatasetLoader:
             'High': 'high',
             'Critical': 'critical'
         }
-        return mapping.get(threat_level, 'medium')
+        return threat_levels.map(mapping).fillna('medium').tolist()
     
-    def _map_firewall_severity(self, severity: int) -> str:
-        """Map syslog severity number to standard levels"""
+    def _map_firewall_severity(self, severities: pd.Series) -> List[str]:
+        """Map syslog severity numbers to standard levels"""
         # Syslog severity levels: 0=Emergency, 1=Alert, 2=Critical, 3=Error, 4=Warning, 5=Notice, 6=Info, 7=Debug
-        if severity <= 2:
-            return 'critical'
-        elif severity <= 4:
-            return 'high'
-        elif severity == 5:
-            return 'medium'
-        else:
-            return 'info'
+        values = severities.to_numpy()
+        return np.select(
+            [values <= 2, values <= 4, values == 5],
+            ['critical', 'high', 'medium'],
+            default='info'
+        ).tolist()
 
 # Singleton instance
 dataset_loader = DatasetLoader()
@@ -1,13 +1,20 @@
-from sqlalchemy import Column, String, DateTime, Float, Integer, Text, JSON, Boolean, ForeignKey
+from sqlalchemy import Column, String, DateTime, Float, Integer, Text, JSON, Boolean, ForeignKey, Index, insert
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, Session
 from datetime import datetime
+from typing import Any, Dict, List
 
 Base = declarative_base()
 
 class LogEntry(Base):
     """Database model for normalized log entries"""
     __tablename__ = "log_entries"
+    __table_args__ = (
+        # Composite indexes for filtering by type/source IP and ordering by time in one index scan
+        Index("ix_log_type_ts", "event_type", "timestamp"),
+        Index("ix_log_srcip_ts", "source_ip", "timestamp"),
+    )
     
     id = Column(String, primary_key=True)
     source = Column(String, nullable=False)
@@ -26,12 +33,16 @@ class LogEntry(Base):
     severity = Column(String, default="info")  # info, low, medium, high, critical
     tags = Column(JSON)  # For flexible tagging
     log_metadata = Column(JSON)  # Additional structured data (renamed from metadata)
-    raw_data = Column(JSON)  # Store original raw log data
+    raw_data = Column(JSON().with_variant(JSONB, "postgresql"))  # Store original raw log data (binary JSONB on Postgres)
     created_at = Column(DateTime, default=datetime.utcnow)
 
 class AlertEntry(Base):
     """Database model for alerts"""
     __tablename__ = "alerts"
+    __table_args__ = (
+        Index("ix_alert_sev_time", "severity", "created_at"),
+        Index("ix_alert_status_time", "status", "created_at"),
+    )
     
     id = Column(String, primary_key=True)
     title = Column(String, nullable=False)
@@ -76,3 +87,9 @@ class ProcessingMetrics(Base):
     processing_time_avg = Column(Float, default=0.0)
     pipeline_stage = Column(String)  # Which stage the metrics are for
     additional_metrics = Column(JSON)  # For extensibility
+
+def bulk_insert_logs(session: Session, rows: List[Dict[str, Any]], batch_size: int = 1000) -> int:
+    """Insert log entry dicts with one Core executemany INSERT per batch, skipping ORM object construction"""
+    for start in range(0, len(rows), batch_size):
+        session.execute(insert(LogEntry), rows[start:start + batch_size])
+    return len(rows)
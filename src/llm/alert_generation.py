@@ -1,8 +1,10 @@
+import asyncio
 import json
 import uuid
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Optional
 from src.llm.base import BaseLLM
+from src.core.serialization import dumps, loads
 from src.models.schemas import NormalizedLogEntry, CorrelationResult, Alert, SeverityLevel, AlertStatus
 
 class AlertGenerationLLM(BaseLLM):
@@ -10,6 +12,7 @@ class AlertGenerationLLM(BaseLLM):
     
     def __init__(self):
         super().__init__('alert_generation')
+        self.max_concurrency = self.config.get('max_concurrency', 8)
     
     def get_system_prompt(self) -> str:
         return """You are an expert security analyst responsible for generating final, actionable security alerts.
@@ -45,39 +48,47 @@ Respond in JSON format with the required fields."""
     
     async def process(self, correlation_results: List[CorrelationResult], log_entries: List[NormalizedLogEntry]) -> List[Alert]:
         """Process correlation results and generate final alerts"""
-        alerts = []
-        
         # Create a mapping of log IDs to log entries
         log_map = {log.id: log for log in log_entries}
         
+        # Serialized log JSON per log ID, so logs shared by several correlations are dumped once
+        log_json_cache = {}
+        
+        # Bounded number of LLM requests in flight at once
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def generate(correlation: CorrelationResult, log_entry: NormalizedLogEntry) -> Alert:
+            async with semaphore:
+                try:
+                    # Create prompt for alert generation
+                    prompt = self._create_prompt(correlation, log_entry, log_json_cache)
+                    
+                    # Get LLM response
+                    response = await self.generate_response(prompt, self.get_system_prompt())
+                    
+                    # Parse response and create alert
+                    return self._parse_response(response, correlation, log_entry)
+                    
+                except Exception as e:
+                    print(f"Error generating alert for correlation {correlation.log_id}: {e}")
+                    # Create a basic alert for failed processing
+                    return self._create_fallback_alert(correlation, log_entry)
+        
+        pending = []
         for correlation in correlation_results:
             if correlation.correlation_score < 0.3:  # Skip low-confidence correlations
                 continue
             
-            try:
-                log_entry = log_map.get(correlation.log_id)
-                if not log_entry:
-                    continue
-                
-                # Create prompt for alert generation
-                prompt = self._create_prompt(correlation, log_entry)
-                
-                # Get LLM response
-                response = await self.generate_response(prompt, self.get_system_prompt())
-                
-                # Parse response and create alert
-                alert = self._parse_response(response, correlation, log_entry)
-                if alert:
-                    alerts.append(alert)
-                
-            except Exception as e:
-                print(f"Error generating alert for correlation {correlation.log_id}: {e}")
-                # Create a basic alert for failed processing
-                alerts.append(self._create_fallback_alert(correlation, log_entry))
+            log_entry = log_map.get(correlation.log_id)
+            if not log_entry:
+                continue
+            
+            pending.append(generate(correlation, log_entry))
         
+        alerts = [alert for alert in await asyncio.gather(*pending) if alert]
         return alerts
     
-    def _create_prompt(self, correlation: CorrelationResult, log_entry: NormalizedLogEntry) -> str:
+    def _create_prompt(self, correlation: CorrelationResult, log_entry: NormalizedLogEntry, log_json_cache: Optional[Dict[str, str]] = None) -> str:
         """Create alert generation prompt"""
         correlation_data = {
             "correlation_score": correlation.correlation_score,
@@ -90,30 +101,19 @@ Respond in JSON format with the required fields."""
             "confidence": correlation.confidence
         }
         
-        log_data = {
-            "id": log_entry.id,
-            "source": log_entry.source,
-            "timestamp": log_entry.timestamp.isoformat(),
-            "event_type": log_entry.event_type,
-            "source_ip": log_entry.source_ip,
-            "destination_ip": log_entry.destination_ip,
-            "user": log_entry.user,
-            "process": log_entry.process,
-            "command": log_entry.command,
-            "file_path": log_entry.file_path,
-            "port": log_entry.port,
-            "message": log_entry.message,
-            "severity": log_entry.severity,
-            "tags": log_entry.tags
-        }
+        log_json = log_json_cache.get(log_entry.id) if log_json_cache is not None else None
+        if log_json is None:
+            log_json = self._log_json(log_entry)
+            if log_json_cache is not None:
+                log_json_cache[log_entry.id] = log_json
         
         return f"""Generate a security alert based on this analysis:
 
 CORRELATION ANALYSIS:
-{json.dumps(correlation_data, indent=2)}
+{dumps(correlation_data, indent=True)}
 
 ORIGINAL LOG ENTRY:
-{json.dumps(log_data, indent=2, default=str)}
+{log_json}
 
 Create a comprehensive security alert that includes:
 1. Clear, actionable title
@@ -146,6 +146,27 @@ Provide the alert in JSON format:
     ]
 }}"""
     
+    def _log_json(self, log_entry: NormalizedLogEntry) -> str:
+        """Serialize the log entry fields shown in the prompt"""
+        log_data = {
+            "id": log_entry.id,
+            "source": log_entry.source,
+            "timestamp": log_entry.timestamp.isoformat(),
+            "event_type": log_entry.event_type,
+            "source_ip": log_entry.source_ip,
+            "destination_ip": log_entry.destination_ip,
+            "user": log_entry.user,
+            "process": log_entry.process,
+            "command": log_entry.command,
+            "file_path": log_entry.file_path,
+            "port": log_entry.port,
+            "message": log_entry.message,
+            "severity": log_entry.severity,
+            "tags": log_entry.tags
+        }
+        
+        return dumps(log_data, indent=True)
+    
     def _parse_response(self, response: str, correlation: CorrelationResult, log_entry: NormalizedLogEntry) -> Alert:
         """Parse LLM response into Alert"""
         try:
@@ -156,7 +177,7 @@ Provide the alert in JSON format:
             if response.endswith('```'):
                 response = response[:-3]
             
-            data = json.loads(response)
+            data = loads(response)
             
             # Map severity string to enum
             severity_map = {
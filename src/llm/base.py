@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 from src.core.config import config
@@ -34,7 +35,9 @@ class BaseLLM(ABC):
                 if system_prompt:
                     full_prompt = f"{system_prompt}\n\n{prompt}"
                 
-                response = self.client.generate_content(
+                # The Gemini client is blocking; run it on a worker thread so concurrent requests overlap
+                response = await asyncio.to_thread(
+                    self.client.generate_content,
                     full_prompt,
                     generation_config={
                         "temperature": self.temperature,
@@ -9,6 +9,7 @@ from src.processing.pipeline import SIEMProcessingPipeline
 from src.dashboard.beautiful_app import BeautifulSIEMDashboard
 from src.models.schemas import RawLogEntry, Alert
 from src.core.config import config
+from src.core import event_loop, log
 
 class SIEMFusionApp:
     """Main SIEM-Fusion application that orchestrates all components"""
@@ -161,8 +162,8 @@ class SIEMFusionApp:
         }
         
         try:
-            # Check collectors
-            collector_status = self.collector_manager.get_collector_status()
+            # Check collectors, probing their backends where supported
+            collector_status = await self.collector_manager.check_collector_health()
             health_status["components"]["collectors"] = collector_status
             
             # Check processing pipeline
@@ -184,7 +185,7 @@ class SIEMFusionApp:
                     else:
                         # For collectors, check if any are healthy
                         healthy_collectors = any(
-                            collector.get("healthy", False) 
+                            collector.get("healthy", False) if isinstance(collector, dict) else collector
                             for collector in status.values()
                         )
                         component_statuses.append("healthy" if healthy_collectors else "error")
@@ -236,4 +237,5 @@ if __name__ == "__main__":
         exit(1)
     
     # Run the application
-    asyncio.run(main())
+    log.configure()
+    event_loop.run(main())
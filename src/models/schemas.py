@@ -1,4 +1,5 @@
 from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from enum import Enum
@@ -20,17 +21,20 @@ class AlertStatus(str, Enum):
     RESOLVED = "resolved"
     FALSE_POSITIVE = "false_positive"
 
-class RawLogEntry(BaseModel):
+@dataclass(slots=True)
+class RawLogEntry:
     """Raw log entry from various sources"""
-    id: Optional[str] = None
+    # A plain slotted dataclass rather than a BaseModel: one is built per collected log,
+    # and collectors already produce typed values, so per-field validation is skipped
     source: LogSource
     timestamp: datetime
     raw_data: str
+    id: Optional[str] = None
     source_ip: Optional[str] = None
     destination_ip: Optional[str] = None
     user: Optional[str] = None
     event_type: Optional[str] = None
-    log_metadata: Dict[str, Any] = Field(default_factory=dict)
+    log_metadata: Dict[str, Any] = field(default_factory=dict)
 
 class NormalizedLogEntry(BaseModel):
     """Normalized log entry with standardized schema"""